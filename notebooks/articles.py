@@ -15,7 +15,7 @@ def _():
 
 @app.cell
 def _(ReportStage, date):
-    data = ReportStage().collect_mcp_articles_multi_day(days_back=7,reference_date =date(2025,6,16) )
+    data, _ = ReportStage().collect_mcp_articles_multi_day(days_back=7,reference_date =date(2025,6,16) )
     return (data,)
 
 
@@ -93,8 +93,8 @@ async def upload_parquet_to_r2(
             logger.debug(f"R2 credentials not configured, skipping upload of {local_file_path}")
             return
         
-        # Create R2 client
-        r2_client = R2Client(settings)
+        # Reuse the shared R2 client
+        r2_client = R2Client.get(settings)
         
         # Create R2 key with same structure as local path
         # parquet/{stage_name}/by-run-date/{date}_last_{days_back}_days.parquet
@@ -29,7 +29,7 @@ class BlueskyDataCollector:
         """
         self.settings = settings
         self.bluesky_client = BlueskyClient(settings)
-        self.r2_client = R2Client(settings)
+        self.r2_client = R2Client.get(settings)
 
     async def collect_posts_by_definition(
         self, search_definition: SearchDefinition, target_date: date | None = None, max_posts: int = 100
@@ -396,8 +396,9 @@ class BlueskyDataCollector:
         file_path = FileManager.get_posts_path(target_date)  # .parquet path
         json_path = file_path.replace(".parquet", ".json")
 
-        # Check for either format
-        return self.r2_client.file_exists(file_path) or self.r2_client.file_exists(json_path)
+        # Check for either format with a single listing of the day's directory
+        existing = self.r2_client.existing_keys(file_path.rsplit("/", 1)[0] + "/")
+        return file_path in existing or json_path in existing
 
     def get_stored_posts_sync(self, target_date: date) -> list[BlueskyPost]:
         """
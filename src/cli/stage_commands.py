@@ -232,8 +232,8 @@ def report(days_back: int, regenerate: bool, output_date: Optional[str], bulk: b
         else:
             result = asyncio.run(report_stage.run_report(days_back, regenerate, parsed_output_date, debug, sitemap, rss))
             
-            if result.get("status") == "already_exists":
-                console.print(f"ℹ️  Report already exists for {parsed_output_date}", style="yellow")
+            if result.get("status") == "up_to_date":
+                console.print(f"ℹ️  Report for {result['date']} is up to date", style="yellow")
                 return
             
             console.print(f"✅ Report completed:", style="green")
@@ -28,7 +28,7 @@ class EvaluationProcessor:
     def __init__(self, settings: Settings):
         """Initialize processor with settings."""
         self.settings = settings
-        self.r2_client = R2Client(settings)
+        self.r2_client = R2Client.get(settings)
         self.fetcher = ArticleFetcher()
         self.extractor = ContentExtractor()
         self.evaluator = AnthropicEvaluator(settings)
@@ -80,6 +80,7 @@ class EvaluationProcessor:
         
         # Process each URL
         evaluations = []
+        evaluated_urls = []
         
         async with self.fetcher:
             for url, post_id, author in urls_to_process:
@@ -108,12 +109,10 @@ class EvaluationProcessor:
                     evaluation = self.evaluator.evaluate_article(extract_result, url)
                     evaluations.append(evaluation)
                     
-                    # Add to registry and mark as evaluated
+                    # Add to registry; marked as evaluated together after the loop
                     registry.add_url(url, post_id, author)
-                    registry.mark_evaluated(
-                        url,
-                        evaluation.is_mcp_related,
-                        evaluation.relevance_score
+                    evaluated_urls.append(
+                        (url, evaluation.is_mcp_related, evaluation.relevance_score)
                     )
                     
                 except Exception as e:
@@ -121,6 +120,8 @@ class EvaluationProcessor:
                     # Still track in registry as attempted
                     registry.add_url(url, post_id, author)
         
+        registry.mark_evaluated_bulk(evaluated_urls)
+        
         # Store evaluations if any
         if evaluations:
             success = await self._store_evaluations(evaluations, target_date)
@@ -43,7 +43,7 @@ class ReportArticle(BaseModel):
         # Extract post ID from AT protocol URI if necessary
         if post_id.startswith("at://"):
             # Extract the last part after the final slash
-            actual_post_id = post_id.split("/")[-1]
+            actual_post_id = post_id[post_id.rfind("/") + 1:]
         else:
             actual_post_id = post_id
         
@@ -1,12 +1,17 @@
 """HTML report generator."""
 
+import os
+import tempfile
 from datetime import date, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, List
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from jinja2.bccache import Bucket
+from jinja2.environment import TemplateStream
 
 from src.models.report import ArchiveLink, HomepageData, ReportArticle, ReportDay
 from src.reports.formatting import get_content_type_icon, get_content_type_with_tooltip, get_language_flag
@@ -14,17 +19,89 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+JINJA_CACHE_DIR = Path(".jinja_cache")
+
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache that creates its directory on the first write."""
+    
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+
+def create_environment(template_dir: Path, cache_dir: Optional[Path] = None) -> Environment:
+    """
+    Create the Jinja2 environment used for report templates.
+    
+    Compiled templates are cached on disk so they are not re-parsed on every run,
+    and loaded templates are never evicted from the in-memory cache.
+    
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        cache_dir: Directory for compiled template bytecode (defaults to JINJA_CACHE_DIR).
+            Resolved to an absolute path here, so a later chdir does not move it; it is
+            created on the first cache write.
+        
+    Returns:
+        Configured Jinja2 environment with custom filters
+    """
+    if cache_dir is None:
+        cache_dir = JINJA_CACHE_DIR
+    
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(['html', 'xml']),
+        bytecode_cache=_LazyBytecodeCache(str(cache_dir.resolve())),
+        auto_reload=False,
+        cache_size=-1
+    )
+    
+    # Add custom filters
+    env.filters['content_icon'] = get_content_type_icon
+    env.filters['content_icon_tooltip'] = get_content_type_with_tooltip
+    env.filters['language_flag'] = get_language_flag
+    
+    return env
+
+
+def _dump_atomic(stream: TemplateStream, path: Path) -> None:
+    """
+    Stream rendered template output into path without ever exposing a partial file.
+    
+    The output goes to a temp file next to path and is moved over it only once
+    rendering finishes; on failure the temp file is removed and path is untouched.
+    
+    Args:
+        stream: Template stream to write
+        path: Target file path
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        stream.dump(str(tmp_path), encoding="utf-8")
+        # NamedTemporaryFile is owner-only; keep the usual permissions of a published page
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class ReportGenerator:
     """Generates HTML reports from collected data."""
     
-    def __init__(self, template_dir: Optional[Path] = None, output_dir: Optional[Path] = None):
+    def __init__(self, template_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                 env: Optional[Environment] = None):
         """
         Initialize report generator.
         
         Args:
             template_dir: Directory containing Jinja2 templates
             output_dir: Directory for generated reports
+            env: Existing Jinja2 environment to reuse instead of creating a new one
         """
         if template_dir is None:
             template_dir = Path(__file__).parent.parent / "templates"
@@ -35,15 +112,7 @@ class ReportGenerator:
         self.output_dir = output_dir
         
         # Set up Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
-        
-        # Add custom filters
-        self.env.filters['content_icon'] = get_content_type_icon
-        self.env.filters['content_icon_tooltip'] = get_content_type_with_tooltip
-        self.env.filters['language_flag'] = get_language_flag
+        self.env = env if env is not None else create_environment(self.template_dir)
     
     def generate_daily_report(self, report_day: ReportDay) -> Path:
         """
@@ -59,17 +128,15 @@ class ReportGenerator:
         report_dir = self.output_dir / "reports" / report_day.date.strftime("%Y-%m-%d")
         report_dir.mkdir(parents=True, exist_ok=True)
         
-        # Render template
+        # Render template, streaming to a temp file that replaces the report when done
+        report_path = report_dir / "report.html"
         template = self.env.get_template("daily.html")
-        html_content = template.render(
+        stream = template.stream(
             date_formatted=report_day.date_formatted,
             articles=report_day.articles,
             active_menu='home'
         )
-        
-        # Write to file
-        report_path = report_dir / "report.html"
-        report_path.write_text(html_content)
+        _dump_atomic(stream, report_path)
         
         logger.info(f"Generated daily report: {report_path}")
         return report_path
@@ -87,19 +154,17 @@ class ReportGenerator:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Render template
+        # Render template, streaming to a temp file that replaces the homepage when done
+        homepage_path = self.output_dir / "index.html"
         template = self.env.get_template("homepage.html")
-        html_content = template.render(
+        stream = template.stream(
             today=homepage_data.today,
             today_articles=homepage_data.today_articles,
             day_sections=homepage_data.day_sections,
             archive_dates=homepage_data.archive_dates,
             active_menu='home'
         )
-        
-        # Write to file
-        homepage_path = self.output_dir / "index.html"
-        homepage_path.write_text(html_content)
+        _dump_atomic(stream, homepage_path)
         
         logger.info(f"Generated homepage: {homepage_path}")
         return homepage_path
@@ -208,7 +273,7 @@ class ReportGenerator:
         atom_link.set("type", "application/rss+xml")
         
         # Sort articles by date and limit
-        sorted_articles = sorted(articles, key=lambda x: x.created_at, reverse=True)[:max_items]
+        sorted_articles = sorted(articles, key=attrgetter("created_at"), reverse=True)[:max_items]
         
         # Add items
         for article in sorted_articles:
@@ -5,10 +5,29 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Iterator, Optional, Any
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 
+def list_markdown_files(directory: Path) -> list[Path]:
+    """
+    List the .md files in a directory with a single os.scandir pass.
+    
+    Replaces directory.glob("*.md"), avoiding glob's pattern matching and
+    per-entry Path work. Unlike that glob, it skips dotfiles (e.g. editor
+    backups or temp files) and entries that are not regular files.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".md")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+
 class Stage(ABC):
     """Base class for all processing stages."""
     
@@ -128,12 +147,12 @@ class ProcessingStage(Stage):
         """Get all .md files from the input stage for the given date."""
         input_dir = self.input_stage_path / target_date.strftime("%Y-%m-%d")
         
-        if not input_dir.exists():
+        # Find all .md files in the input directory; scandir itself reports a missing directory
+        try:
+            return iter(list_markdown_files(input_dir))
+        except FileNotFoundError:
             logger.warning(f"Input directory does not exist: {input_dir}")
             return iter([])
-        
-        # Find all .md files in the input directory
-        return input_dir.glob("*.md")
     
     def get_output_path(self, input_path: Path, target_date: date) -> Path:
         """
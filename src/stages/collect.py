@@ -16,6 +16,9 @@ from src.utils.url_expansion import URLExpander
 
 logger = logging.getLogger(__name__)
 
+# Expanded short URLs are kept here between runs so reruns skip the redirect lookups
+URL_EXPANSION_CACHE_PATH = Path(".url_cache") / "expanded_urls.sqlite"
+
 
 class CollectStage(InputStage):
     """Collects posts from Bluesky and stores as individual markdown files."""
@@ -89,7 +92,7 @@ class CollectStage(InputStage):
         """Expand shortened URLs in collected posts."""
         logger.info("Expanding shortened URLs in collected posts...")
         
-        async with URLExpander() as expander:
+        async with URLExpander(cache_path=URL_EXPANSION_CACHE_PATH) as expander:
             expanded_posts = []
             
             for post in posts:
@@ -10,6 +10,7 @@ from src.evaluation.anthropic_client import AnthropicEvaluator
 from src.content.models import ExtractedContent
 from src.stages.base import ProcessingStage
 from src.stages.markdown import MarkdownFile
+from src.stages.mcp_index import update_mcp_index
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +69,9 @@ class EvaluateStage(ProcessingStage):
         """Process a single fetched content file for evaluation.
         
         NOTE: This method is kept for backward compatibility but is not used
-        in the new multi-day scanning approach.
+        in the new multi-day scanning approach. It rewrites the date's MCP index
+        for every file, so it is meant for one-off use; batch work goes through
+        run_evaluate, which writes each index once per date.
         """
         try:
             # Load the fetched content
@@ -131,6 +134,7 @@ This content was evaluated for MCP relevance.
             # Save to output path
             output_path = self.get_output_path(input_path, target_date)
             eval_md.save(output_path)
+            update_mcp_index(output_path.parent, {output_path.name: evaluation_data})
             
             logger.info(f"Evaluated and saved: {output_path.name} (relevance: {evaluation.relevance_score})")
             return output_path
@@ -197,6 +201,10 @@ This content was evaluated for MCP relevance.
             if fetch_dir.exists():
                 logger.info(f"Scanning fetched content from {current_date}")
                 
+                # Collect this date's index updates and write the index once per date
+                output_dir = self.base_path / self.stage_name / current_date.strftime("%Y-%m-%d")
+                index_updates = {}
+                
                 for input_path in fetch_dir.glob("*.md"):
                     try:
                         # Load fetched content
@@ -246,8 +254,9 @@ This content was evaluated for MCP relevance.
                             self.ensure_stage_dir(current_date)
                             
                             # Save to output path in the same date directory
-                            output_path = self.base_path / self.stage_name / current_date.strftime("%Y-%m-%d") / input_path.name
+                            output_path = output_dir / input_path.name
                             md_file.save(output_path)
+                            index_updates[output_path.name] = evaluation_data
                             
                             evaluated_urls.add(url)
                             new_evaluations += 1
@@ -274,6 +283,9 @@ This content was evaluated for MCP relevance.
                     except Exception as e:
                         failed += 1
                         logger.error(f"Failed to process {input_path}: {e}")
+                
+                if index_updates:
+                    update_mcp_index(output_dir, index_updates)
             
             current_date += timedelta(days=1)
         
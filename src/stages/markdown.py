@@ -2,14 +2,20 @@
 
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class MarkdownFile:
     """Represents a Markdown file with YAML frontmatter."""
     
-    def __init__(self, frontmatter: Dict[str, Any], content: str):
+    def __init__(self, frontmatter: Dict[str, Any], content: Optional[str]):
         self.frontmatter = frontmatter
         self.content = content
     
@@ -21,6 +27,34 @@ class MarkdownFile:
         
         return cls.from_string(text)
     
+    @classmethod
+    def load_frontmatter_only(cls, file_path: Path) -> "MarkdownFile":
+        """
+        Load only the frontmatter of a Markdown file.
+        
+        Stops reading at the closing '---' marker, so the content is never read
+        or parsed. The returned file has content set to None.
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if not f.readline().startswith('---'):
+                return cls({}, None)
+            
+            yaml_lines = []
+            for line in f:
+                if line.rstrip() == '---':
+                    break
+                yaml_lines.append(line)
+            else:
+                # No closing marker
+                return cls({}, None)
+        
+        try:
+            frontmatter = yaml.load(''.join(yaml_lines), Loader=SafeLoader) or {}
+        except yaml.YAMLError:
+            frontmatter = {}
+        
+        return cls(frontmatter, None)
+    
     @classmethod
     def from_string(cls, text: str) -> "MarkdownFile":
         """Parse a Markdown string with frontmatter."""
@@ -28,9 +62,16 @@ class MarkdownFile:
         return cls(frontmatter, content)
     
     def save(self, file_path: Path) -> None:
-        """Save the Markdown file with frontmatter."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(self.to_string())
+        """Save the Markdown file with frontmatter, skipping the write if unchanged."""
+        new_bytes = self.to_string().encode('utf-8')
+
+        try:
+            if file_path.stat().st_size == len(new_bytes) and file_path.read_bytes() == new_bytes:
+                return
+        except FileNotFoundError:
+            pass
+
+        file_path.write_bytes(new_bytes)
     
     def to_string(self) -> str:
         """Convert to string format with frontmatter."""
@@ -69,7 +110,7 @@ def parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
         
         # Parse YAML frontmatter
         yaml_content = parts[1].strip()
-        frontmatter = yaml.safe_load(yaml_content) or {}
+        frontmatter = yaml.load(yaml_content, Loader=SafeLoader) or {}
         
         # Get the content (remove leading newlines)
         content = parts[2].lstrip('\n')
@@ -0,0 +1,106 @@
+"""Per-date index of evaluation results, so reports can skip irrelevant files unopened."""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+MCP_INDEX_FILENAME = "mcp_index.json"
+
+
+def load_mcp_index(stage_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the evaluation index for a date directory.
+
+    Returns:
+        Mapping of evaluated filename to its is_mcp_related, relevance_score and
+        the mtime_ns/size of the file when it was indexed, or an empty dict if the
+        directory has no readable index
+    """
+    try:
+        with open(stage_dir / MCP_INDEX_FILENAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable MCP index in {stage_dir}: {e}")
+        return {}
+
+
+def record_mcp_evaluation(index: Dict[str, Dict[str, Any]], path: Path, evaluation: Dict[str, Any]) -> None:
+    """
+    Record the MCP relevance of one saved evaluation file in an in-memory index.
+
+    The entry carries the file's mtime and size, so a file rewritten later
+    (e.g. re-evaluated) no longer matches it until it is recorded again.
+    """
+    stat = os.stat(path)
+    index[path.name] = {
+        "is_mcp_related": evaluation.get("is_mcp_related", False),
+        "relevance_score": evaluation.get("relevance_score", 0.0),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size
+    }
+
+
+def save_mcp_index(stage_dir: Path, index: Dict[str, Dict[str, Any]]) -> None:
+    """Write a date directory's index, replacing the old one only once fully written."""
+    with tempfile.NamedTemporaryFile(
+        'w', dir=stage_dir, prefix=f".{MCP_INDEX_FILENAME}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, stage_dir / MCP_INDEX_FILENAME)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def update_mcp_index(stage_dir: Path, evaluations: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Record the MCP relevance of evaluated files in their date directory's index.
+
+    Indexing is best-effort: the evaluation files are already saved, and files
+    missing from the index are still parsed by the report stage. Errors reading
+    a file or writing the index are logged, never raised.
+
+    Args:
+        stage_dir: Date directory holding the evaluated files
+        evaluations: Mapping of evaluated filename to its evaluation data
+    """
+    index = load_mcp_index(stage_dir)
+    for filename, evaluation in evaluations.items():
+        try:
+            record_mcp_evaluation(index, stage_dir / filename, evaluation)
+        except OSError as e:
+            logger.warning(f"Failed to index {filename}: {e}")
+    try:
+        save_mcp_index(stage_dir, index)
+    except OSError as e:
+        logger.warning(f"Failed to write MCP index in {stage_dir}: {e}")
+
+
+def may_be_relevant(index: Dict[str, Dict[str, Any]], path: Path, min_relevance: float) -> bool:
+    """
+    Check if an evaluated file could pass the report filter.
+
+    Files missing from the index (e.g. evaluated before the index existed) or
+    changed since they were indexed are always treated as candidates so they
+    get parsed normally.
+    """
+    entry = index.get(path.name)
+    if entry is None:
+        return True
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return True
+    if entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+        return True
+    return entry["is_mcp_related"] and entry["relevance_score"] >= min_relevance
@@ -3,18 +3,105 @@
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterator, Optional, List
+import json
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, lru_cache, partial
+from itertools import repeat
+from operator import attrgetter
+from statistics import fmean
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment
 
 from src.models.report import ReportArticle, ReportDay, HomepageData, ArchiveLink, DaySection
-from src.reports.generator import ReportGenerator
-from src.reports.formatting import get_content_type_icon, get_content_type_with_tooltip, get_language_flag
-from src.stages.base import ProcessingStage
+from src.reports.generator import JINJA_CACHE_DIR, ReportGenerator, create_environment
+from src.stages.base import ProcessingStage, list_markdown_files
 from src.stages.markdown import MarkdownFile
+from src.stages.mcp_index import load_mcp_index, may_be_relevant
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, parsing in-process through the cache beats shipping work to a pool
+PARSE_POOL_MIN_FILES = 500
+
+
+def _may_be_mcp_related(path: Path) -> bool:
+    """
+    Cheap byte-level pre-check run before any YAML parsing.
+    
+    Evaluated frontmatter is written by yaml.dump, which always renders a related
+    file as 'is_mcp_related: true'. If the marker is missing from the frontmatter
+    the file can be skipped unparsed; anything unexpected falls through to the parser.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(8192)
+    
+    end = head.find(b'\n---', 3)
+    if not head.startswith(b'---') or end == -1:
+        return True
+    return b'is_mcp_related: true' in head[:end]
+
+
+def _parse_eval_md(path: str, min_relevance: float) -> Optional[dict]:
+    """
+    Load the frontmatter of an evaluated file if it is MCP-related above the threshold.
+    Module-level so worker processes can run it; filtering here means rejected files
+    are never sent back to the parent process. The returned dict comes from the
+    mtime-keyed load cache and must not be mutated.
+    """
+    try:
+        if not _may_be_mcp_related(Path(path)):
+            return None
+        frontmatter = _load_md(Path(path), frontmatter_only=True).frontmatter
+    except Exception as e:
+        logger.error(f"Failed to process {path} for report: {e}")
+        return None
+    
+    # Only include MCP-related articles above threshold
+    evaluation = frontmatter.get("evaluation", {})
+    if not evaluation.get("is_mcp_related", False):
+        return None
+    if evaluation.get("relevance_score", 0.0) < min_relevance:
+        return None
+    
+    return frontmatter
+
+
+def _parse_created_at(created_at_str: str) -> datetime:
+    """Parse a collect-stage created_at timestamp, dropping a UTC suffix ('Z' or '+00:00')."""
+    if created_at_str.endswith('Z'):
+        return datetime.fromisoformat(created_at_str[:-1])
+    if created_at_str.endswith('+00:00'):
+        return datetime.fromisoformat(created_at_str[:-6])
+    return datetime.fromisoformat(created_at_str)
+
+
+@lru_cache(maxsize=8192)
+def _load_md_cached(path_str: str, mtime_ns: int, frontmatter_only: bool) -> MarkdownFile:
+    """Load a Markdown file, cached by path and mtime. Callers must not mutate the result."""
+    if frontmatter_only:
+        return MarkdownFile.load_frontmatter_only(Path(path_str))
+    return MarkdownFile.load(Path(path_str))
+
+
+def _load_md(path: Path, frontmatter_only: bool = False) -> MarkdownFile:
+    """Load a Markdown file through the mtime-keyed cache."""
+    return _load_md_cached(str(path), path.stat().st_mtime_ns, frontmatter_only)
+
+
+@cache
+def _get_environment(template_dir_str: str, cache_dir_str: str) -> Environment:
+    """
+    Return the Jinja2 environment for a template directory, shared by all stage instances.
+    
+    Keyed on the resolved bytecode cache dir as well, so stages created after a chdir
+    get an environment caching under their own working directory.
+    """
+    return create_environment(Path(template_dir_str), cache_dir=Path(cache_dir_str))
+
 
 class ReportStage(ProcessingStage):
     """Generates daily reports from evaluated content."""
@@ -28,52 +115,75 @@ class ReportStage(ProcessingStage):
         
         self.template_dir = template_dir
         
-        # Set up Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
-        
-        # Add custom filters (for potential template previews)
-        self.env.filters['content_icon'] = get_content_type_icon
-        self.env.filters['content_icon_tooltip'] = get_content_type_with_tooltip
-        self.env.filters['language_flag'] = get_language_flag
+        # Set up Jinja2 environment, shared with the report generator
+        self.env = _get_environment(str(self.template_dir), str(JINJA_CACHE_DIR.resolve()))
+        self.generator = ReportGenerator(self.template_dir, env=self.env)
+        
+        # Lazily built map of collect-stage post ID -> post file path
+        self._post_index: Optional[dict[str, Path]] = None
+        # Lazily built per-date maps of fetch-stage URL -> fetch file path
+        self._fetch_indexes: dict[date, dict[str, Path]] = {}
+        # Serializes index builds so collection worker threads never build the same date twice
+        self._fetch_index_lock = threading.Lock()
+        # Memoized collect_mcp_articles results keyed by (date, min_relevance, debug)
+        self._collected_articles: dict[tuple[date, float, bool], List[ReportArticle]] = {}
     
     def get_inputs(self, target_date: date) -> Iterator[Path]:
         """Get all evaluated files for the date."""
         return super().get_inputs(target_date)
     
-    def _get_fetch_data(self, url: str, target_date: date) -> dict:
-        """Get content metadata from fetch stage for a given URL."""
-        from datetime import timedelta
-        
-        # Search for the fetch file across multiple days (content might be fetched on different dates)
-        for days_back in range(10):  # Search up to 10 days back
-            search_date = target_date - timedelta(days=days_back)
-            fetch_dir = Path("stages/fetch") / search_date.strftime("%Y-%m-%d")
+    def _get_fetch_index(self, search_date: date) -> dict[str, Path]:
+        """Map URL -> fetch file for one fetch-stage date directory, built once per date."""
+        fetch_index = self._fetch_indexes.get(search_date)
+        if fetch_index is not None:
+            return fetch_index
+        
+        with self._fetch_index_lock:
+            # Another worker thread may have built it while we waited
+            fetch_index = self._fetch_indexes.get(search_date)
+            if fetch_index is not None:
+                return fetch_index
             
-            if not fetch_dir.exists():
-                continue
+            fetch_index = {}
+            fetch_dir = self.base_path / "fetch" / search_date.strftime("%Y-%m-%d")
+            try:
+                fetch_files = list_markdown_files(fetch_dir)
+            except FileNotFoundError:
+                fetch_files = []
             
-            # Look for file with this URL
-            for fetch_file in fetch_dir.glob("*.md"):
+            for fetch_file in fetch_files:
                 try:
-                    fetch_md = MarkdownFile.load(fetch_file)
-                    file_url = fetch_md.get_frontmatter_value("url")
-                    
-                    if str(file_url) == str(url):
-                        # Found the fetch data for this URL
-                        return {
-                            "title": fetch_md.get_frontmatter_value("title"),
-                            "domain": fetch_md.get_frontmatter_value("domain"),
-                            "author": fetch_md.get_frontmatter_value("author"),
-                            "medium": fetch_md.get_frontmatter_value("medium"),
-                            "word_count": fetch_md.get_frontmatter_value("word_count"),
-                            "content_markdown": fetch_md.content
-                        }
+                    file_url = _load_md(fetch_file, frontmatter_only=True).frontmatter.get("url")
                 except Exception as e:
                     logger.debug(f"Error reading fetch file {fetch_file}: {e}")
                     continue
+                # Keep the first file for a URL, as the linear search did
+                fetch_index.setdefault(str(file_url), fetch_file)
+            
+            self._fetch_indexes[search_date] = fetch_index
+            return fetch_index
+    
+    def _get_fetch_data(self, url: str, target_date: date) -> dict:
+        """Get content metadata from fetch stage for a given URL."""
+        # Search for the fetch file across multiple days (content might be fetched on different dates)
+        target_ordinal = target_date.toordinal()
+        for days_back in range(10):  # Search up to 10 days back
+            fetch_file = self._get_fetch_index(date.fromordinal(target_ordinal - days_back)).get(str(url))
+            if fetch_file is None:
+                continue
+            
+            try:
+                fetch_fm = _load_md(fetch_file, frontmatter_only=True).frontmatter
+                # Found the fetch data for this URL
+                return {
+                    "title": fetch_fm.get("title"),
+                    "domain": fetch_fm.get("domain"),
+                    "author": fetch_fm.get("author"),
+                    "medium": fetch_fm.get("medium"),
+                    "word_count": fetch_fm.get("word_count")
+                }
+            except Exception as e:
+                logger.debug(f"Error reading fetch file {fetch_file}: {e}")
         
         # Fallback if not found
         logger.warning(f"Could not find fetch data for URL: {url}")
@@ -82,11 +192,35 @@ class ReportStage(ProcessingStage):
             "domain": "",
             "author": None,
             "medium": None,
-            "word_count": 0,
-            "content_markdown": ""
+            "word_count": 0
         }
     
-    def collect_mcp_articles_multi_day(self, days_back: int, reference_date: date, min_relevance: float = 0.3, debug: bool = False) -> List[ReportArticle]:
+    def _get_post_index(self) -> dict[str, Path]:
+        """Index all collect-stage post files by post ID with a single directory walk."""
+        if self._post_index is not None:
+            return self._post_index
+        
+        post_index = {}
+        collect_path = self.base_path / "collect"
+        try:
+            with os.scandir(collect_path) as date_dirs:
+                # Sort by date so that the newest file wins if a post appears more than once
+                for date_dir in sorted(date_dirs, key=attrgetter("name")):
+                    if not date_dir.is_dir():
+                        continue
+                    with os.scandir(date_dir.path) as entries:
+                        for entry in entries:
+                            name = entry.name
+                            if name.startswith("post_") and name.endswith(".md"):
+                                post_index[name[5:-3]] = Path(entry.path)
+        except FileNotFoundError:
+            logger.warning(f"Collect stage directory does not exist: {collect_path}")
+        
+        logger.debug(f"Indexed {len(post_index)} collected posts")
+        self._post_index = post_index
+        return post_index
+    
+    def collect_mcp_articles_multi_day(self, days_back: int, reference_date: date, min_relevance: float = 0.3, debug: bool = False, deduplicate: bool = True, skip_dates: Optional[set[date]] = None) -> tuple[List[ReportArticle], dict[date, List[ReportArticle]]]:
         """
         Collect MCP-related articles from evaluated content across multiple days.
         This method is used as fallback when no content exists for the specific date.
@@ -95,174 +229,85 @@ class ReportStage(ProcessingStage):
             days_back: Number of days to look back
             reference_date: Reference date for the scan
             min_relevance: Minimum relevance score to include
+            debug: Whether to include debug information
+            deduplicate: Whether to drop articles whose URL was already seen on an earlier day;
+                URLs are always deduplicated within a date, like collect_mcp_articles does
+            skip_dates: Dates in the range that should not be scanned
             
         Returns:
-            List of ReportArticle objects
+            Tuple of (all ReportArticle objects, articles grouped by their date)
         """
-        from datetime import timedelta
-        
         articles = []
-        processed_urls = set()  # Deduplicate by URL
+        per_date_articles: dict[date, List[ReportArticle]] = {}
+        processed_urls: set[str | tuple[date, str]] = set()  # URLs, or (date, URL) pairs when not deduplicating across days
         articles_by_date = {}
         
-        # Scan each day in the range
-        end_date = reference_date
-        start_date = end_date - timedelta(days=days_back)
+        # Gather evaluated files for each day in the range, oldest first
+        start_ordinal = reference_date.toordinal() - days_back
+        dated_paths = []
         
-        current_date = start_date
-        while current_date <= end_date:
+        for ordinal in range(start_ordinal, reference_date.toordinal() + 1):
+            current_date = date.fromordinal(ordinal)
+            if skip_dates and current_date in skip_dates:
+                continue
+            
             # Check if evaluate stage has data for this date
-            evaluate_dir = self.base_path / self.input_stage_name / current_date.strftime("%Y-%m-%d")
+            evaluate_dir = self.input_stage_path / current_date.isoformat()
             
-            if evaluate_dir.exists():
-                logger.info(f"Scanning evaluated content from {current_date}")
-                date_articles = 0
-                
-                for input_path in evaluate_dir.glob("*.md"):
-                    try:
-                        md_file = MarkdownFile.load(input_path)
-                        evaluation = md_file.get_frontmatter_value("evaluation", {})
-                        
-                        # Only include MCP-related articles above threshold
-                        if not evaluation.get("is_mcp_related", False):
-                            continue
-                        
-                        relevance_score = evaluation.get("relevance_score", 0.0)
-                        if relevance_score < min_relevance:
-                            continue
-                        
-                        # Extract post information
-                        url = md_file.get_frontmatter_value("url")
-                        
-                        # Deduplicate by URL
-                        if url in processed_urls:
-                            logger.debug(f"Skipping duplicate URL: {url}")
-                            continue
-                        processed_urls.add(url)
-                        
-                        found_in_posts = md_file.get_frontmatter_value("found_in_posts", [])
-                        
-                        # Get original post data to extract correct author and timestamp
-                        author = "unknown"
-                        created_at = datetime.utcnow()  # fallback
-                        post_id = None
-                        
-                        if found_in_posts:
-                            post_id = found_in_posts[0]
-                            
-                            # Look up the original post to get author and timestamp
-                            try:
-                                # Extract post ID from AT protocol URI
-                                if post_id.startswith("at://did:"):
-                                    actual_post_id = post_id.split("/")[-1]
-                                else:
-                                    actual_post_id = post_id
-                                
-                                # Find the original post file in collect stage - search across all dates
-                                post_found = False
-                                for search_days_back in range(days_back + 7):  # Search a bit further back
-                                    search_date = reference_date - timedelta(days=search_days_back)
-                                    collect_dir = Path("stages/collect") / search_date.strftime("%Y-%m-%d")
-                                    post_file = collect_dir / f"post_{actual_post_id}.md"
-                                    
-                                    if post_file.exists():
-                                        post_md = MarkdownFile.load(post_file)
-                                        author = post_md.get_frontmatter_value("author", "unknown")
-                                        created_at_str = post_md.get_frontmatter_value("created_at")
-                                        if created_at_str:
-                                            # Handle both ISO format with and without timezone
-                                            if created_at_str.endswith('+00:00'):
-                                                created_at = datetime.fromisoformat(created_at_str.replace('+00:00', 'Z').rstrip('Z'))
-                                            else:
-                                                created_at = datetime.fromisoformat(created_at_str.rstrip('Z'))
-                                        post_found = True
-                                        break
-                                
-                                if not post_found:
-                                    logger.warning(f"Could not find original post for {post_id}")
-                                    
-                            except Exception as e:
-                                logger.warning(f"Failed to load original post data for {post_id}: {e}")
-                        
-                        if not post_id:
-                            post_id = f"synthetic_{url}"
-                        
-                        # Get content metadata from fetch stage
-                        fetch_data = self._get_fetch_data(url, current_date)
-                        
-                        # Use fetch data for author fallback if post not found
-                        if author == "unknown":
-                            author = fetch_data.get("domain", "unknown")
-                        
-                        # Prepare evaluation dict in expected format
-                        eval_dict = {
-                            "url": url,
-                            "title": fetch_data.get("title", "Untitled"),
-                            "perex": evaluation.get("perex", evaluation.get("summary", "")),
-                            "relevance_score": relevance_score,
-                            "domain": fetch_data.get("domain", ""),
-                            "content_type": evaluation.get("content_type", "article"),
-                            "language": evaluation.get("language", "en")
-                        }
-                        
-                        # IMPORTANT: Only include articles posted on the specific current_date
-                        if created_at.date() == current_date:
-                            debug_filename = input_path.name if debug else None
-                            article = ReportArticle.from_post_and_evaluation(
-                                post_id=post_id,
-                                author=author,
-                                created_at=created_at,
-                                evaluation=eval_dict,
-                                debug_filename=debug_filename
-                            )
-                            articles.append(article)
-                            date_articles += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process {input_path} for report: {e}")
-                
-                if date_articles > 0:
-                    articles_by_date[str(current_date)] = date_articles
+            try:
+                input_paths = list_markdown_files(evaluate_dir)
+            except FileNotFoundError:
+                input_paths = None
             
-            current_date += timedelta(days=1)
-        
-        # Sort by relevance score (highest first)
-        articles.sort(key=lambda x: x.relevance_score, reverse=True)
-        
-        logger.info(f"Collected {len(articles)} unique MCP-related articles from {days_back} days (date-filtered)")
-        if articles_by_date:
-            for date_str, count in sorted(articles_by_date.items()):
-                logger.info(f"  - {date_str}: {count} articles")
-        
-        return articles
-    
-    def collect_mcp_articles(self, target_date: date, min_relevance: float = 0.3, debug: bool = False) -> List[ReportArticle]:
-        """
-        Collect MCP-related articles from evaluated content for a single date.
-        Only includes articles that were originally posted on the target date.
-        """
-        articles = []
+            if input_paths is not None:
+                logger.info(f"Scanning evaluated content from {current_date}")
+                # Skip files the evaluation index already rules out, without opening them
+                mcp_index = load_mcp_index(evaluate_dir)
+                dated_paths.extend(
+                    (current_date, input_path)
+                    for input_path in input_paths
+                    if may_be_relevant(mcp_index, input_path, min_relevance)
+                )
         
-        for input_path in self.get_inputs(target_date):
+        # Parse and filter through the load cache; only large batches of this
+        # CPU-bound YAML parsing are worth spreading over worker processes
+        parse = partial(_parse_eval_md, min_relevance=min_relevance)
+        path_strs = [str(path) for _, path in dated_paths]
+        if len(path_strs) >= PARSE_POOL_MIN_FILES:
+            # Spawn rather than fork: this runs inside an asyncio loop next to
+            # ThreadPoolExecutor threads, and a forked child can inherit locks that
+            # no thread will ever release. The pool lives only for this batch.
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+                frontmatters = list(pool.map(parse, path_strs, chunksize=32))
+        else:
+            frontmatters = list(map(parse, path_strs))
+        
+        # Shared created_at for articles whose original post can't be found
+        fallback_created_at = datetime.utcnow()
+        
+        for (current_date, input_path), frontmatter in zip(dated_paths, frontmatters):
+            if frontmatter is None:
+                continue
+            
             try:
-                md_file = MarkdownFile.load(input_path)
-                evaluation = md_file.get_frontmatter_value("evaluation", {})
+                evaluation = frontmatter["evaluation"]
+                relevance_score = evaluation.get("relevance_score", 0.0)
                 
-                # Only include MCP-related articles above threshold
-                if not evaluation.get("is_mcp_related", False):
-                    continue
+                # Extract post information
+                url = frontmatter.get("url")
                 
-                relevance_score = evaluation.get("relevance_score", 0.0)
-                if relevance_score < min_relevance:
+                # Deduplicate by URL, across all days or only within each date
+                url_key = url if deduplicate else (current_date, url)
+                if url_key in processed_urls:
+                    logger.debug(f"Skipping duplicate URL: {url}")
                     continue
+                processed_urls.add(url_key)
                 
-                # Extract post information from original post data
-                url = md_file.get_frontmatter_value("url")
-                found_in_posts = md_file.get_frontmatter_value("found_in_posts", [])
+                found_in_posts = frontmatter.get("found_in_posts", [])
                 
                 # Get original post data to extract correct author and timestamp
                 author = "unknown"
-                created_at = datetime.utcnow()  # fallback
+                created_at = None
                 post_id = None
                 
                 if found_in_posts:
@@ -272,48 +317,37 @@ class ReportStage(ProcessingStage):
                     try:
                         # Extract post ID from AT protocol URI
                         if post_id.startswith("at://did:"):
-                            actual_post_id = post_id.split("/")[-1]
+                            actual_post_id = post_id[post_id.rfind("/") + 1:]
                         else:
                             actual_post_id = post_id
                         
-                        # Search for the original post - first try target date, then expand search
-                        post_found = False
-                        from datetime import timedelta
-                        
-                        for search_days_back in range(10):  # Search up to 10 days back
-                            search_date = target_date - timedelta(days=search_days_back)
-                            collect_dir = Path("stages/collect") / search_date.strftime("%Y-%m-%d")
-                            post_file = collect_dir / f"post_{actual_post_id}.md"
-                            
-                            if post_file.exists():
-                                post_md = MarkdownFile.load(post_file)
-                                author = post_md.get_frontmatter_value("author", "unknown")
-                                created_at_str = post_md.get_frontmatter_value("created_at")
-                                if created_at_str:
-                                    # Handle both ISO format with and without timezone
-                                    if created_at_str.endswith('+00:00'):
-                                        created_at = datetime.fromisoformat(created_at_str.replace('+00:00', 'Z').rstrip('Z'))
-                                    else:
-                                        created_at = datetime.fromisoformat(created_at_str.rstrip('Z'))
-                                post_found = True
-                                break
+                        # Find the original post file in collect stage
+                        post_file = self._get_post_index().get(actual_post_id)
                         
-                        if not post_found:
+                        if post_file is not None:
+                            post_fm = _load_md(post_file, frontmatter_only=True).frontmatter
+                            author = post_fm.get("author", "unknown")
+                            created_at_str = post_fm.get("created_at")
+                            if created_at_str:
+                                created_at = _parse_created_at(created_at_str)
+                        else:
                             logger.warning(f"Could not find original post for {post_id}")
-                        
+                            
                     except Exception as e:
                         logger.warning(f"Failed to load original post data for {post_id}: {e}")
                 
                 if not post_id:
                     post_id = f"synthetic_{url}"
                 
-                # IMPORTANT: Only include articles that were posted on the target date
-                if created_at.date() != target_date:
-                    logger.debug(f"Skipping article from {created_at.date()} - not from target date {target_date}")
+                if created_at is None:
+                    created_at = fallback_created_at
+                
+                # IMPORTANT: Only include articles posted on the specific current_date
+                if created_at.date() != current_date:
                     continue
                 
                 # Get content metadata from fetch stage
-                fetch_data = self._get_fetch_data(url, target_date)
+                fetch_data = self._get_fetch_data(url, current_date)
                 
                 # Use fetch data for author fallback if post not found
                 if author == "unknown":
@@ -338,16 +372,193 @@ class ReportStage(ProcessingStage):
                     evaluation=eval_dict,
                     debug_filename=debug_filename
                 )
-                
                 articles.append(article)
+                per_date_articles.setdefault(current_date, []).append(article)
+                date_key = str(current_date)
+                articles_by_date[date_key] = articles_by_date.get(date_key, 0) + 1
                 
             except Exception as e:
                 logger.error(f"Failed to process {input_path} for report: {e}")
         
         # Sort by relevance score (highest first)
-        articles.sort(key=lambda x: x.relevance_score, reverse=True)
+        articles.sort(key=attrgetter("relevance_score"), reverse=True)
+        
+        logger.info(f"Collected {len(articles)} unique MCP-related articles from {days_back} days (date-filtered)")
+        if articles_by_date:
+            for date_str, count in sorted(articles_by_date.items()):
+                logger.info(f"  - {date_str}: {count} articles")
+        
+        return articles, per_date_articles
+    
+    def _collect_archive_links(self, output_date: date, days_covered: set[date]) -> List[ArchiveLink]:
+        """Build archive links for the 14 days before output_date that are not already covered."""
+        # One multi-day scan instead of a full collection per archived day. Dates already
+        # in the homepage day sections are not scanned, and URLs are deduplicated only
+        # within each date so counts match the per-day reports
+        _, per_date_articles = self.collect_mcp_articles_multi_day(
+            13, date.fromordinal(output_date.toordinal() - 1), deduplicate=False, skip_dates=days_covered
+        )
+        
+        return [
+            ArchiveLink.create(
+                report_date=check_date,
+                article_count=len(per_date_articles[check_date])
+            )
+            for check_date in sorted(per_date_articles, reverse=True)
+        ]
+    
+    def _process_evaluated_file(self, input_path: Path, target_date: date, min_relevance: float, debug: bool, fallback_created_at: datetime) -> Optional[ReportArticle]:
+        """
+        Build a ReportArticle from one evaluated file for the single-date report.
+        
+        fallback_created_at is used for articles whose original post can't be found,
+        computed once per collection like in collect_mcp_articles_multi_day.
+        
+        Returns:
+            ReportArticle, or None if the file is filtered out or fails to load
+        """
+        try:
+            if not _may_be_mcp_related(input_path):
+                return None
+            fm = _load_md(input_path, frontmatter_only=True).frontmatter
+            evaluation = fm.get("evaluation", {})
+            
+            # Only include MCP-related articles above threshold
+            if not evaluation.get("is_mcp_related", False):
+                return None
+            
+            relevance_score = evaluation.get("relevance_score", 0.0)
+            if relevance_score < min_relevance:
+                return None
+            
+            # Extract post information from original post data
+            url = fm.get("url")
+            found_in_posts = fm.get("found_in_posts", [])
+            
+            # Get original post data to extract correct author and timestamp
+            author = "unknown"
+            created_at = None
+            post_id = None
+            
+            if found_in_posts:
+                post_id = found_in_posts[0]
+                
+                # Look up the original post to get author and timestamp
+                try:
+                    # Extract post ID from AT protocol URI
+                    if post_id.startswith("at://did:"):
+                        actual_post_id = post_id[post_id.rfind("/") + 1:]
+                    else:
+                        actual_post_id = post_id
+                    
+                    # Find the original post file in collect stage
+                    post_file = self._get_post_index().get(actual_post_id)
+                    
+                    if post_file is not None:
+                        post_fm = _load_md(post_file, frontmatter_only=True).frontmatter
+                        author = post_fm.get("author", "unknown")
+                        created_at_str = post_fm.get("created_at")
+                        if created_at_str:
+                            created_at = _parse_created_at(created_at_str)
+                    else:
+                        logger.warning(f"Could not find original post for {post_id}")
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to load original post data for {post_id}: {e}")
+            
+            if not post_id:
+                post_id = f"synthetic_{url}"
+            
+            if created_at is None:
+                created_at = fallback_created_at
+            
+            # IMPORTANT: Only include articles that were posted on the target date
+            if created_at.date() != target_date:
+                logger.debug(f"Skipping article from {created_at.date()} - not from target date {target_date}")
+                return None
+            
+            # Get content metadata from fetch stage
+            fetch_data = self._get_fetch_data(url, target_date)
+            
+            # Use fetch data for author fallback if post not found
+            if author == "unknown":
+                author = fetch_data.get("domain", "unknown")
+            
+            # Prepare evaluation dict in expected format
+            eval_dict = {
+                "url": url,
+                "title": fetch_data.get("title", "Untitled"),
+                "perex": evaluation.get("perex", evaluation.get("summary", "")),
+                "relevance_score": relevance_score,
+                "domain": fetch_data.get("domain", ""),
+                "content_type": evaluation.get("content_type", "article"),
+                "language": evaluation.get("language", "en")
+            }
+            
+            debug_filename = input_path.name if debug else None
+            return ReportArticle.from_post_and_evaluation(
+                post_id=post_id,
+                author=author,
+                created_at=created_at,
+                evaluation=eval_dict,
+                debug_filename=debug_filename
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to process {input_path} for report: {e}")
+            return None
+    
+    def collect_mcp_articles(self, target_date: date, min_relevance: float = 0.3, debug: bool = False) -> List[ReportArticle]:
+        """
+        Collect MCP-related articles from evaluated content for a single date.
+        Only includes articles that were originally posted on the target date.
+        
+        Results are memoized per stage instance, so the report, homepage, archive and
+        bulk passes over the same date share one collection.
+        """
+        cache_key = (target_date, min_relevance, debug)
+        cached_articles = self._collected_articles.get(cache_key)
+        if cached_articles is not None:
+            return list(cached_articles)
+        
+        mcp_index = load_mcp_index(self.input_stage_path / target_date.strftime("%Y-%m-%d"))
+        
+        # Skip files the evaluation index already rules out, without opening them
+        input_paths = [
+            input_path for input_path in self.get_inputs(target_date)
+            if may_be_relevant(mcp_index, input_path, min_relevance)
+        ]
+        
+        # File reads and lookups overlap well across threads
+        articles = []
+        if input_paths:
+            self._get_post_index()  # Build once up front rather than racing in the workers
+            with ThreadPoolExecutor() as executor:
+                results = executor.map(
+                    self._process_evaluated_file,
+                    input_paths,
+                    repeat(target_date),
+                    repeat(min_relevance),
+                    repeat(debug),
+                    repeat(datetime.utcnow())  # Shared created_at for articles whose post is missing
+                )
+                # Deduplicate by URL, keeping the first file in directory order like the multi-day scan
+                seen_urls: set[str] = set()
+                for article in results:
+                    if article is None:
+                        continue
+                    url = str(article.url)
+                    if url in seen_urls:
+                        logger.debug(f"Skipping duplicate URL: {url}")
+                        continue
+                    seen_urls.add(url)
+                    articles.append(article)
+        
+        # Sort by relevance score (highest first)
+        articles.sort(key=attrgetter("relevance_score"), reverse=True)
         logger.info(f"Collected {len(articles)} articles specifically from {target_date}")
-        return articles
+        self._collected_articles[cache_key] = articles
+        return list(articles)
     
     def process_item(self, input_path: Path, target_date: date) -> Optional[Path]:
         """
@@ -358,23 +569,53 @@ class ReportStage(ProcessingStage):
     
     def should_process_item(self, input_path: Path, target_date: date) -> bool:
         """Check if report should be generated (not if individual items should be processed)."""
-        # For reports, we check if the report already exists
-        report_path = self.get_report_output_path(target_date)
-        return not report_path.exists()
+        # For reports, we check if the report is missing or older than its evaluated inputs
+        return self._is_report_stale(target_date)
     
-    def get_report_output_path(self, target_date: date) -> Path:
-        """Get output path for the daily report."""
+    def _report_path(self, target_date: date) -> Path:
+        """Get path of the daily report without touching the filesystem."""
         # Reports go to output/reports/ directory with simple date format
-        reports_dir = Path("output") / "reports" / target_date.strftime("%Y-%m-%d")
-        reports_dir.mkdir(parents=True, exist_ok=True)
-        return reports_dir / "report.html"
+        return Path("output") / "reports" / target_date.strftime("%Y-%m-%d") / "report.html"
+    
+    def get_report_output_path(self, target_date: date) -> Path:
+        """Get output path for the daily report, creating its directory."""
+        report_path = self._report_path(target_date)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        return report_path
     
     def get_metadata_output_path(self, target_date: date) -> Path:
         """Get output path for the report metadata."""
         stage_dir = self.ensure_stage_dir(target_date)
         return stage_dir / "report_meta.md"
     
-    async def run_report(self, days_back: int = 7, regenerate: bool = True, output_date: Optional[date] = None, debug: bool = False, generate_sitemap: bool = True, generate_rss: bool = True) -> dict:
+    def get_metadata_json_path(self, target_date: date) -> Path:
+        """Get output path for the machine-readable report metadata."""
+        stage_dir = self.ensure_stage_dir(target_date)
+        return stage_dir / "report_meta.json"
+    
+    def _is_report_stale(self, target_date: date) -> bool:
+        """Check if the report is missing or older than any of its evaluated inputs."""
+        try:
+            report_mtime = os.stat(self._report_path(target_date)).st_mtime_ns
+        except FileNotFoundError:
+            return True
+        
+        input_dir = self.input_stage_path / target_date.strftime("%Y-%m-%d")
+        try:
+            with os.scandir(input_dir) as entries:
+                input_mtimes = [
+                    entry.stat().st_mtime_ns
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return False
+        
+        # Without inputs for the date there is nothing newer to rebuild from
+        # (the report came from the multi-day fallback)
+        return bool(input_mtimes) and max(input_mtimes) > report_mtime
+    
+    async def run_report(self, days_back: int = 7, regenerate: bool = True, output_date: Optional[date] = None, debug: bool = False, generate_sitemap: bool = True, generate_rss: bool = True, prefetched_articles: Optional[List[ReportArticle]] = None) -> dict:
         """
         Run the report stage, scanning evaluated content from the last N days.
         
@@ -385,12 +626,11 @@ class ReportStage(ProcessingStage):
             debug: Whether to include debug information
             generate_sitemap: Whether to generate sitemap.xml (default True)
             generate_rss: Whether to generate rss.xml (default True)
+            prefetched_articles: Articles already collected for output_date, to skip collecting them again
         
         Returns:
             Summary of report generation results
         """
-        from datetime import timedelta
-        
         if output_date is None:
             output_date = date.today()
         
@@ -399,134 +639,101 @@ class ReportStage(ProcessingStage):
         # Ensure output directory exists
         self.ensure_stage_dir(output_date)
         
-        # Check if report already exists and whether to regenerate
+        # Check if an up-to-date report already exists and whether to regenerate
         if not regenerate and not self.should_process_item(Path(), output_date):
-            logger.info(f"Report already exists for {output_date} and regenerate=False")
+            logger.info(f"Report for {output_date} is up to date and regenerate=False")
             return {
                 "stage": self.stage_name,
                 "date": output_date,
-                "status": "already_exists"
+                "status": "up_to_date"
             }
         
         # First try to collect articles from the specific output date
-        articles = self.collect_mcp_articles(output_date, debug=debug)
+        if prefetched_articles is not None:
+            articles = list(prefetched_articles)
+        else:
+            articles = self.collect_mcp_articles(output_date, debug=debug)
         
         # If no articles found for the output date, fall back to recent content
         if not articles:
             logger.info(f"No articles found for {output_date}, scanning last {days_back} days for fallback")
-            articles = self.collect_mcp_articles_multi_day(days_back, output_date, debug=debug)
+            articles, _ = self.collect_mcp_articles_multi_day(days_back, output_date, debug=debug)
             
             # Since we already filtered by date in collect_mcp_articles_multi_day,
             # no additional filtering needed here
             logger.info(f"Using {len(articles)} articles from multi-day fallback")
         
+        html_content = None
+        homepage_content = None
+        
         if not articles:
             logger.warning(f"No MCP-related articles found in the last {days_back} days")
-            
-            # Create empty report metadata
-            metadata = {
-                "date": output_date.isoformat(),
-                "days_scanned": days_back,
-                "mcp_related_articles": 0,
-                "report_generated_at": datetime.utcnow().isoformat() + 'Z',
-                "stage": "reported",
-                "articles": []
-            }
-            
-            metadata_md = MarkdownFile(metadata, f"# Daily Report Summary\n\nNo MCP-related articles found in the last {days_back} days.")
-            metadata_path = self.get_metadata_output_path(output_date)
-            metadata_md.save(metadata_path)
-            
-            return {
-                "stage": self.stage_name,
-                "date": output_date,
-                "days_scanned": days_back,
-                "articles_found": 0,
-                "report_generated": False,
-                "metadata_saved": True
-            }
-        
-        # Create ReportDay
-        report_day = ReportDay.create(output_date, articles)
+        else:
+            # Create ReportDay
+            report_day = ReportDay.create(output_date, articles)
         
-        # Generate HTML report using ReportGenerator for consistency
-        generator = ReportGenerator()
-        html_content = None
-        homepage_content = None
+            # Generate HTML report using ReportGenerator for consistency
+            generator = self.generator
         
-        try:
-            # Generate daily report
-            daily_path = generator.generate_daily_report(report_day)
-            html_content = True
-            logger.info(f"Generated HTML report: {daily_path}")
-            # Generate enhanced homepage with minimum 7 articles
-            day_sections = self.collect_homepage_articles(min_articles=7, debug=debug)
+            try:
+                # Generate daily report
+                daily_path = generator.generate_daily_report(report_day)
+                html_content = True
+                logger.info(f"Generated HTML report: {daily_path}")
+                # Generate enhanced homepage with minimum 7 articles
+                day_sections = self.collect_homepage_articles(min_articles=7, debug=debug)
 
-            # Get archive dates by checking for recent evaluations (beyond the day sections)
-            archive_links = []
-            days_covered = {section.date for section in day_sections}
+                # Get archive dates by checking for recent evaluations (beyond the day sections)
+                days_covered = {section.date for section in day_sections}
+                archive_links = self._collect_archive_links(output_date, days_covered)
             
-            for check_days_back in range(1, 15):  # Check last 15 days for archive
-                check_date = date.fromordinal(output_date.toordinal() - check_days_back)
-                
-                # Skip dates already included in day sections
-                if check_date in days_covered:
-                    continue
-                
-                # Check if there are evaluated articles for this date
-                evaluated_articles = self.collect_mcp_articles(check_date, debug=False)  # No debug for archive check
-                if evaluated_articles:
-                    archive_links.append(ArchiveLink.create(
-                        report_date=check_date,
-                        article_count=len(evaluated_articles)
-                    ))
-            
-            # Create enhanced homepage data
-            homepage_data = HomepageData.create_enhanced(
-                day_sections=day_sections,
-                archive_dates=archive_links
-            )
+                # Create enhanced homepage data
+                homepage_data = HomepageData.create_enhanced(
+                    day_sections=day_sections,
+                    archive_dates=archive_links
+                )
             
-            # Generate homepage
-            homepage_path = generator.generate_homepage(homepage_data)
-            homepage_content = True
-            logger.info(f"Generated homepage: {homepage_path}")
+                # Generate homepage
+                homepage_path = generator.generate_homepage(homepage_data)
+                homepage_content = True
+                logger.info(f"Generated homepage: {homepage_path}")
             
-            # Generate sitemap if requested
-            if generate_sitemap:
-                try:
-                    sitemap_path = generator.generate_sitemap()
-                    logger.info(f"Generated sitemap: {sitemap_path}")
-                except Exception as e:
-                    logger.error(f"Failed to generate sitemap: {e}")
+                # Generate sitemap if requested
+                if generate_sitemap:
+                    try:
+                        sitemap_path = generator.generate_sitemap()
+                        logger.info(f"Generated sitemap: {sitemap_path}")
+                    except Exception as e:
+                        logger.error(f"Failed to generate sitemap: {e}")
             
-            # Generate RSS feed if requested
-            if generate_rss:
-                try:
-                    # Collect all recent articles for RSS feed
-                    all_articles = []
-                    for section in day_sections:
-                        all_articles.extend(section.articles)
+                # Generate RSS feed if requested
+                if generate_rss:
+                    try:
+                        # Collect all recent articles for RSS feed
+                        all_articles = []
+                        for section in day_sections:
+                            all_articles.extend(section.articles)
                     
-                    rss_path = generator.generate_rss(all_articles)
-                    logger.info(f"Generated RSS feed: {rss_path}")
-                except Exception as e:
-                    logger.error(f"Failed to generate RSS feed: {e}")
+                        rss_path = generator.generate_rss(all_articles)
+                        logger.info(f"Generated RSS feed: {rss_path}")
+                    except Exception as e:
+                        logger.error(f"Failed to generate RSS feed: {e}")
             
-        except Exception as e:
-            logger.error(f"Failed to generate HTML reports: {e}")
-            html_content = None
-            homepage_content = None
+            except Exception as e:
+                logger.error(f"Failed to generate HTML reports: {e}")
+                html_content = None
+                homepage_content = None
         
         # Create and save metadata
-        article_summaries = []
-        for article in articles:
-            article_summaries.append({
+        article_summaries = [
+            {
                 "url": str(article.url),
                 "relevance_score": article.relevance_score,
                 "title": article.title,
                 "perex": article.perex[:100] + "..." if len(article.perex) > 100 else article.perex
-            })
+            }
+            for article in articles
+        ]
         
         metadata = {
             "date": output_date.isoformat(),
@@ -537,10 +744,28 @@ class ReportStage(ProcessingStage):
             "articles": article_summaries
         }
         
-        metadata_content = f"# Daily Report Summary\n\nGenerated report for {report_day.date_formatted} with {len(articles)} MCP-related articles from the last {days_back} days."
-        metadata_md = MarkdownFile(metadata, metadata_content)
+        # Regenerating a report from the same inputs leaves both metadata files untouched;
+        # only the generation timestamp differs, so it is left out of the comparison
         metadata_path = self.get_metadata_output_path(output_date)
-        metadata_md.save(metadata_path)
+        metadata_json_path = self.get_metadata_json_path(output_date)
+        try:
+            previous_metadata = json.loads(metadata_json_path.read_text())
+        except (OSError, ValueError):
+            previous_metadata = None
+        metadata_unchanged = (
+            isinstance(previous_metadata, dict)
+            and metadata_path.exists()
+            and {**previous_metadata, "report_generated_at": None} == {**metadata, "report_generated_at": None}
+        )
+        
+        if not metadata_unchanged:
+            if articles:
+                metadata_content = f"# Daily Report Summary\n\nGenerated report for {report_day.date_formatted} with {len(articles)} MCP-related articles from the last {days_back} days."
+            else:
+                metadata_content = f"# Daily Report Summary\n\nNo MCP-related articles found in the last {days_back} days."
+            metadata_md = MarkdownFile(metadata, metadata_content)
+            metadata_md.save(metadata_path)
+            metadata_json_path.write_text(json.dumps(metadata, indent=2))
         
         result = {
             "stage": self.stage_name,
@@ -550,7 +775,7 @@ class ReportStage(ProcessingStage):
             "report_generated": html_content is not None,
             "homepage_generated": homepage_content is not None,
             "metadata_saved": True,
-            "avg_relevance": round(sum(a.relevance_score for a in articles) / len(articles), 3) if articles else 0
+            "avg_relevance": round(fmean(map(attrgetter("relevance_score"), articles)), 3) if articles else 0
         }
         
         logger.info(f"Report stage completed: {result}")
@@ -571,8 +796,6 @@ class ReportStage(ProcessingStage):
         Returns:
             Summary of bulk report generation results
         """
-        from datetime import timedelta
-        
         if output_date is None:
             output_date = date.today()
         
@@ -583,8 +806,14 @@ class ReportStage(ProcessingStage):
         dates_processed = []
         
         # Scan each day in the range
+        output_ordinal = output_date.toordinal()
         for days_ago in range(days_back + 1):  # Include the output_date itself
-            check_date = output_date - timedelta(days=days_ago)
+            check_date = date.fromordinal(output_ordinal - days_ago)
+            
+            # Check if we should regenerate before paying for the article scan
+            if not regenerate and not self.should_process_item(Path(), check_date):
+                logger.info(f"Report for {check_date} is up to date and regenerate=False, skipping")
+                continue
             
             # Check if there are evaluated articles for this date
             articles = self.collect_mcp_articles(check_date, debug=debug)
@@ -592,14 +821,9 @@ class ReportStage(ProcessingStage):
             if articles:
                 logger.info(f"Found {len(articles)} articles for {check_date}, generating report...")
                 
-                # Check if we should regenerate
-                if not regenerate and not self.should_process_item(Path(), check_date):
-                    logger.info(f"Report already exists for {check_date} and regenerate=False, skipping")
-                    continue
-                
                 try:
                     # Generate report for this specific date (without sitemap/RSS for individual reports)
-                    result = await self.run_report(0, regenerate, check_date, debug, generate_sitemap=False, generate_rss=False)  # days_back=0 to avoid recursion
+                    result = await self.run_report(0, regenerate, check_date, debug, generate_sitemap=False, generate_rss=False, prefetched_articles=articles)  # days_back=0 to avoid recursion
                     
                     if result.get("report_generated"):
                         reports_generated += 1
@@ -621,23 +845,8 @@ class ReportStage(ProcessingStage):
                 day_sections = self.collect_homepage_articles(min_articles=10, debug=debug)
                 
                 # Get archive dates by checking for recent evaluations (beyond the day sections)
-                archive_links = []
                 days_covered = {section.date for section in day_sections}
-                
-                for check_days_back in range(1, 15):  # Check last 15 days for archive
-                    check_date = output_date - timedelta(days=check_days_back)
-                    
-                    # Skip dates already included in day sections
-                    if check_date in days_covered:
-                        continue
-                    
-                    # Check if there are evaluated articles for this date
-                    evaluated_articles = self.collect_mcp_articles(check_date, debug=False)
-                    if evaluated_articles:
-                        archive_links.append(ArchiveLink.create(
-                            report_date=check_date,
-                            article_count=len(evaluated_articles)
-                        ))
+                archive_links = self._collect_archive_links(output_date, days_covered)
                 
                 # Create enhanced homepage data
                 homepage_data = HomepageData.create_enhanced(
@@ -646,7 +855,7 @@ class ReportStage(ProcessingStage):
                 )
                 
                 # Generate homepage
-                generator = ReportGenerator()
+                generator = self.generator
                 homepage_path = generator.generate_homepage(homepage_data)
                 logger.info(f"✅ Updated homepage with {reports_generated} regenerated reports: {homepage_path}")
                 
@@ -700,11 +909,9 @@ class ReportStage(ProcessingStage):
         Returns:
             List of DaySection objects, ordered from newest to oldest
         """
-        from datetime import timedelta
-        
         day_sections = []
         total_articles = 0
-        today = date.today()
+        today_ordinal = date.today().toordinal()
         
         logger.info(f"Collecting homepage articles with minimum {min_articles} articles")
         
@@ -713,7 +920,7 @@ class ReportStage(ProcessingStage):
             if total_articles >= min_articles:
                 break
                 
-            check_date = today - timedelta(days=days_ago)
+            check_date = date.fromordinal(today_ordinal - days_ago)
             articles = self.collect_mcp_articles(check_date, debug=debug)
             
             if articles:
@@ -1,14 +1,22 @@
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from src.models.common import FileType, date_to_path
 
 
+@lru_cache(maxsize=2048)
+def _dated_path(base_path: str, date_obj: date, filename: str) -> str:
+    """Build a "{base}/YYYY/MM/DD/{filename}" path, memoized since the same dates recur all run."""
+    return f"{base_path}/{date_to_path(date_obj)}/{filename}"
+
+
 class FileManager:
     """Manages file paths and naming conventions for storage."""
 
     DATA_BASE_PATH = "data"
     REPORTS_BASE_PATH = "reports"
+    _VALID_BASES = (DATA_BASE_PATH, REPORTS_BASE_PATH)
 
     @staticmethod
     def get_posts_path(date_obj: date | datetime) -> str:
@@ -24,8 +32,7 @@ class FileManager:
         if isinstance(date_obj, datetime):
             date_obj = date_obj.date()
 
-        date_path = date_to_path(date_obj)
-        return f"{FileManager.DATA_BASE_PATH}/{date_path}/posts.parquet"
+        return _dated_path(FileManager.DATA_BASE_PATH, date_obj, "posts.parquet")
 
     @staticmethod
     def get_evaluations_path(date_obj: date | datetime) -> str:
@@ -41,8 +48,7 @@ class FileManager:
         if isinstance(date_obj, datetime):
             date_obj = date_obj.date()
 
-        date_path = date_to_path(date_obj)
-        return f"{FileManager.DATA_BASE_PATH}/{date_path}/evaluations.parquet"
+        return _dated_path(FileManager.DATA_BASE_PATH, date_obj, "evaluations.parquet")
 
     @staticmethod
     def get_report_path(date_obj: date | datetime) -> str:
@@ -58,8 +64,7 @@ class FileManager:
         if isinstance(date_obj, datetime):
             date_obj = date_obj.date()
 
-        date_path = date_to_path(date_obj)
-        return f"{FileManager.REPORTS_BASE_PATH}/{date_path}/report.html"
+        return _dated_path(FileManager.REPORTS_BASE_PATH, date_obj, "report.html")
 
     @staticmethod
     def get_metadata_path(date_obj: date | datetime) -> str:
@@ -75,8 +80,7 @@ class FileManager:
         if isinstance(date_obj, datetime):
             date_obj = date_obj.date()
 
-        date_path = date_to_path(date_obj)
-        return f"{FileManager.DATA_BASE_PATH}/{date_path}/metadata.json"
+        return _dated_path(FileManager.DATA_BASE_PATH, date_obj, "metadata.json")
 
     @staticmethod
     def list_dates_with_data(
@@ -112,9 +116,8 @@ class FileManager:
             if ".." in path or path.startswith("/"):
                 return False
 
-            # Check if path starts with valid base
-            valid_bases = [FileManager.DATA_BASE_PATH, FileManager.REPORTS_BASE_PATH]
-            if not any(path.startswith(base) for base in valid_bases):
+            # Check if path starts with valid base (str.startswith checks the whole tuple in C)
+            if not path.startswith(FileManager._VALID_BASES):
                 return False
 
             # Additional validation could be added here
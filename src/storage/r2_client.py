@@ -1,18 +1,38 @@
+import hashlib
+import io
 from pathlib import Path
-import tempfile
+import threading
+import time
 from typing import Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 import pandas as pd
 
 from src.config.settings import Settings
+from src.storage.file_manager import FileManager
 from src.utils.logging import get_logger
 from src.utils.url_registry import URLRegistry
 
 logger = get_logger(__name__)
 
+# Files above the threshold are sent as concurrent multipart transfers
+MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE_BYTES = 16 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 8
+
+# Read size when streaming objects into memory
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# How long a prefix listing from existing_keys is trusted before listing again
+PREFIX_CACHE_TTL_SECONDS = 60.0
+
+# Shared clients from R2Client.get, keyed by endpoint, credentials and bucket
+_INSTANCES: dict[tuple[str, str, str, str], "R2Client"] = {}
+_INSTANCES_LOCK = threading.Lock()
+
 
 class R2Client:
     """Cloudflare R2 storage client using S3-compatible API."""
@@ -32,20 +52,78 @@ class R2Client:
             retries={"max_attempts": 3, "mode": "adaptive"},
             signature_version="s3v4",
             s3={"addressing_style": "path"},
+            max_pool_connections=64,
         )
 
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.r2_endpoint_url,
+        # Create the session up front; the client derived from it is shared by all threads
+        self._session = boto3.session.Session(
             aws_access_key_id=settings.r2_access_key_id,
             aws_secret_access_key=settings.r2_secret_access_key,
+        )
+        self.s3_client = self._session.client(
+            "s3",
+            endpoint_url=settings.r2_endpoint_url,
             config=config,
         )
 
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+            multipart_chunksize=MULTIPART_CHUNKSIZE_BYTES,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+            use_threads=True,
+        )
+
+        # prefix -> (listed at, keys under prefix), kept in sync with our own writes
+        self._prefix_cache: dict[str, tuple[float, set[str]]] = {}
+        # Clients are shared across threads, so every cache read and update holds this
+        self._prefix_cache_lock = threading.Lock()
+
         logger.info(f"R2Client initialized for bucket: {self.bucket_name}")
 
+    @classmethod
+    def get(cls, settings: Settings) -> "R2Client":
+        """
+        Get the shared R2 client for the given settings, creating it on first use.
+
+        Reusing one client keeps its connection pool warm across pipeline stages
+        instead of paying credential resolution and TLS setup per instance.
+
+        Args:
+            settings: Application settings containing R2 credentials
+
+        Returns:
+            Shared R2Client for these credentials and bucket
+        """
+        key = (
+            settings.r2_endpoint_url,
+            settings.r2_access_key_id,
+            settings.r2_secret_access_key,
+            settings.r2_bucket_name,
+        )
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(key)
+            if instance is None:
+                instance = cls(settings)
+                _INSTANCES[key] = instance
+            return instance
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """
+        Drop the shared clients handed out by get.
+
+        The next get call creates a fresh client, e.g. after credentials
+        change or between tests that patch boto3.
+        """
+        with _INSTANCES_LOCK:
+            _INSTANCES.clear()
+
     def upload_file(
-        self, file_path: str | Path, key: str, content_type: str | None = None
+        self,
+        file_path: str | Path,
+        key: str,
+        content_type: str | None = None,
+        skip_unchanged: bool = False,
     ) -> bool:
         """
         Upload a file to R2.
@@ -54,11 +132,25 @@ class R2Client:
             file_path: Local file path to upload
             key: Object key in R2 (path within bucket)
             content_type: Optional MIME type
+            skip_unchanged: Check the stored object first and skip the upload if it
+                already has this content; worth the extra HEAD only for keys that
+                are rewritten with mostly unchanged content. The check compares the
+                file's MD5 with the object's ETag, which is not an MD5 for multipart
+                uploads, so files at or above MULTIPART_THRESHOLD_BYTES are never
+                skipped
 
         Returns:
             True if successful, False otherwise
         """
         try:
+            # Files below the multipart threshold get a plain MD5 ETag we can compare against
+            if skip_unchanged and Path(file_path).stat().st_size < MULTIPART_THRESHOLD_BYTES:
+                with open(file_path, "rb") as f:
+                    digest = hashlib.file_digest(f, lambda: hashlib.md5(usedforsecurity=False)).hexdigest()
+                if self._matches_remote(key, digest, content_type):
+                    logger.debug(f"Skipped upload of {file_path}, {key} is unchanged")
+                    return True
+
             extra_args = {}
             if content_type:
                 extra_args["ContentType"] = content_type
@@ -68,16 +160,22 @@ class R2Client:
                 self.bucket_name,
                 key,
                 ExtraArgs=extra_args if extra_args else None,
+                Config=self.transfer_config,
             )
-            logger.info(f"Successfully uploaded {file_path} to {key}")
+            self._note_key_written(key)
+            logger.debug(f"Successfully uploaded {file_path} to {key}")
             return True
 
-        except (ClientError, BotoCoreError) as e:
+        except (ClientError, BotoCoreError, OSError) as e:
             logger.exception(f"Failed to upload {file_path} to {key}: {e}")
             return False
 
     def upload_bytes(
-        self, data: bytes, key: str, content_type: str | None = None
+        self,
+        data: bytes,
+        key: str,
+        content_type: str | None = None,
+        skip_unchanged: bool = False,
     ) -> bool:
         """
         Upload bytes data to R2.
@@ -86,11 +184,18 @@ class R2Client:
             data: Bytes data to upload
             key: Object key in R2
             content_type: Optional MIME type
+            skip_unchanged: Check the stored object first and skip the upload if it
+                already has this content; an object stored by a multipart upload
+                has a non-MD5 ETag and is always rewritten (see upload_file)
 
         Returns:
             True if successful, False otherwise
         """
         try:
+            if skip_unchanged and self._matches_remote(key, hashlib.md5(data, usedforsecurity=False).hexdigest(), content_type):
+                logger.debug(f"Skipped upload of bytes, {key} is unchanged")
+                return True
+
             extra_args = {}
             if content_type:
                 extra_args["ContentType"] = content_type
@@ -98,13 +203,30 @@ class R2Client:
             self.s3_client.put_object(
                 Bucket=self.bucket_name, Key=key, Body=data, **extra_args
             )
-            logger.info(f"Successfully uploaded bytes to {key}")
+            self._note_key_written(key)
+            logger.debug(f"Successfully uploaded bytes to {key}")
             return True
 
         except (ClientError, BotoCoreError) as e:
             logger.exception(f"Failed to upload bytes to {key}: {e}")
             return False
 
+    def _matches_remote(self, key: str, md5_hex: str, content_type: str | None) -> bool:
+        """
+        Check if the stored object already has this content, so the upload can be skipped.
+
+        Single-part uploads have the content MD5 as their ETag. Any lookup
+        failure (including a missing object) means the upload should proceed.
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except (ClientError, BotoCoreError):
+            return False
+
+        if content_type and response.get("ContentType") != content_type:
+            return False
+        return response["ETag"].strip('"') == md5_hex
+
     def download_file(self, key: str, file_path: str | Path) -> bool:
         """
         Download a file from R2.
@@ -118,10 +240,12 @@ class R2Client:
         """
         try:
             # Ensure parent directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            FileManager.ensure_local_directory(file_path)
 
-            self.s3_client.download_file(self.bucket_name, key, str(file_path))
-            logger.info(f"Successfully downloaded {key} to {file_path}")
+            self.s3_client.download_file(
+                self.bucket_name, key, str(file_path), Config=self.transfer_config
+            )
+            logger.debug(f"Successfully downloaded {key} to {file_path}")
             return True
 
         except (ClientError, BotoCoreError) as e:
@@ -140,8 +264,13 @@ class R2Client:
         """
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            data = response["Body"].read()
-            logger.info(f"Successfully downloaded bytes from {key}")
+
+            # Read in large chunks rather than urllib3's small default reads
+            buffer = io.BytesIO()
+            for chunk in response["Body"].iter_chunks(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+            data = buffer.getvalue()
+            logger.debug(f"Successfully downloaded bytes from {key}")
             return data
 
         except (ClientError, BotoCoreError) as e:
@@ -168,35 +297,91 @@ class R2Client:
             logger.exception(f"Error checking if {key} exists: {e}")
             return False
 
-    def list_files(self, prefix: str | None = None, max_keys: int = 1000) -> list[str]:
+    def list_files(self, prefix: str | None = None, max_keys: int | None = None) -> list[str]:
         """
         List files in R2 with optional prefix filter.
 
+        Follows continuation tokens, so listings are no longer cut off at the
+        1000 keys a single request returns.
+
         Args:
             prefix: Optional prefix to filter results
-            max_keys: Maximum number of keys to return
+            max_keys: Maximum number of keys to return (default: no limit)
 
         Returns:
             List of object keys
         """
         try:
-            params = {"Bucket": self.bucket_name, "MaxKeys": max_keys}
+            params = {"Bucket": self.bucket_name}
             if prefix:
                 params["Prefix"] = prefix
-
-            response = self.s3_client.list_objects_v2(**params)
-
-            if "Contents" not in response:
-                return []
-
-            keys = [obj["Key"] for obj in response["Contents"]]
-            logger.info(f"Listed {len(keys)} files with prefix '{prefix}'")
+            if max_keys is not None:
+                params["PaginationConfig"] = {"MaxItems": max_keys}
+
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            keys = [
+                obj["Key"]
+                for page in paginator.paginate(**params)
+                for obj in page.get("Contents", [])
+            ]
+            logger.debug(f"Listed {len(keys)} files with prefix '{prefix}'")
             return keys
 
         except (ClientError, BotoCoreError) as e:
             logger.exception(f"Failed to list files with prefix '{prefix}': {e}")
             return []
 
+    def existing_keys(self, prefix: str) -> frozenset[str]:
+        """
+        Get all keys under a prefix with one paginated listing.
+
+        Checking membership in the result replaces a head_object per key.
+        Listings are cached per prefix for PREFIX_CACHE_TTL_SECONDS and kept
+        up to date with uploads and deletes made through this client.
+
+        Args:
+            prefix: Key prefix to list
+
+        Returns:
+            Read-only snapshot of the object keys under the prefix (empty if
+            listing fails); the cached listing itself is never handed out
+        """
+        with self._prefix_cache_lock:
+            cached = self._prefix_cache.get(prefix)
+            if cached is not None and time.monotonic() - cached[0] < PREFIX_CACHE_TTL_SECONDS:
+                return frozenset(cached[1])
+
+        try:
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            keys = {
+                obj["Key"]
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+                for obj in page.get("Contents", [])
+            }
+
+        except (ClientError, BotoCoreError) as e:
+            logger.exception(f"Failed to list keys with prefix '{prefix}': {e}")
+            return frozenset()
+
+        snapshot = frozenset(keys)
+        with self._prefix_cache_lock:
+            self._prefix_cache[prefix] = (time.monotonic(), keys)
+        return snapshot
+
+    def _note_key_written(self, key: str) -> None:
+        """Add a newly written key to any cached listing that covers it."""
+        with self._prefix_cache_lock:
+            for prefix, (_, keys) in self._prefix_cache.items():
+                if key.startswith(prefix):
+                    keys.add(key)
+
+    def _note_key_deleted(self, key: str) -> None:
+        """Drop a deleted key from any cached listing that covers it."""
+        with self._prefix_cache_lock:
+            for prefix, (_, keys) in self._prefix_cache.items():
+                if key.startswith(prefix):
+                    keys.discard(key)
+
     def delete_file(self, key: str) -> bool:
         """
         Delete a file from R2.
@@ -209,7 +394,8 @@ class R2Client:
         """
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            logger.info(f"Successfully deleted {key}")
+            self._note_key_deleted(key)
+            logger.debug(f"Successfully deleted {key}")
             return True
 
         except (ClientError, BotoCoreError) as e:
@@ -226,27 +412,27 @@ class R2Client:
         registry_key = "urls/url_registry.parquet"
         
         try:
-            if not self.file_exists(registry_key):
-                logger.info("URL registry not found in R2, will create new one")
-                return None
-            
-            # Download to temp file
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                if self.download_file(registry_key, tmp.name):
-                    registry = URLRegistry.from_parquet(tmp.name)
-                    logger.info(f"Downloaded URL registry with {len(registry.df)} entries")
-                    return registry
-                else:
+            # Read straight into memory; the transfer manager fetches large registries
+            # as concurrent ranged GETs and small ones with a single GET
+            buffer = io.BytesIO()
+            try:
+                self.s3_client.download_fileobj(
+                    self.bucket_name, registry_key, buffer, Config=self.transfer_config
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                    logger.info("URL registry not found in R2, will create new one")
                     return None
+                raise
+            
+            buffer.seek(0)
+            registry = URLRegistry.from_parquet(buffer)
+            logger.info(f"Downloaded URL registry with {len(registry.df)} entries")
+            return registry
         
         except Exception as e:
             logger.exception(f"Failed to download URL registry: {e}")
             return None
-        
-        finally:
-            # Clean up temp file
-            if 'tmp' in locals():
-                Path(tmp.name).unlink(missing_ok=True)
     
     def upload_url_registry(self, registry: URLRegistry) -> bool:
         """
@@ -261,27 +447,36 @@ class R2Client:
         registry_key = "urls/url_registry.parquet"
         
         try:
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                registry.to_parquet(tmp.name)
-                
-                # Upload to R2
-                success = self.upload_file(
-                    tmp.name, 
+            # Serialize in memory, no temp file round-trip
+            buffer = io.BytesIO()
+            registry.to_parquet(buffer)
+            
+            # Small registries go as a single PUT without the transfer manager
+            if buffer.tell() < MULTIPART_THRESHOLD_BYTES:
+                # The registry is rewritten every run, often without changes
+                success = self.upload_bytes(
+                    buffer.getvalue(),
+                    registry_key,
+                    content_type="application/octet-stream",
+                    skip_unchanged=True
+                )
+            else:
+                buffer.seek(0)
+                self.s3_client.upload_fileobj(
+                    buffer,
+                    self.bucket_name,
                     registry_key,
-                    content_type="application/octet-stream"
+                    ExtraArgs={"ContentType": "application/octet-stream"},
+                    Config=self.transfer_config,
                 )
-                
-                if success:
-                    logger.info(f"Uploaded URL registry with {len(registry.df)} entries")
-                
-                return success
+                self._note_key_written(registry_key)
+                success = True
+            
+            if success:
+                logger.info(f"Uploaded URL registry with {len(registry.df)} entries")
+            
+            return success
         
         except Exception as e:
             logger.exception(f"Failed to upload URL registry: {e}")
             return False
-        
-        finally:
-            # Clean up temp file
-            if 'tmp' in locals():
-                Path(tmp.name).unlink(missing_ok=True)
@@ -5,6 +5,7 @@ This module provides filtering capabilities for BlueskyPost objects
 based on language detection and other criteria.
 """
 
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -12,7 +13,7 @@ from src.models.post import BlueskyPost
 from src.utils.language_detection import LanguageType
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterResult:
     """Result of filtering operation with statistics."""
     
@@ -61,11 +62,14 @@ def filter_posts_by_language(
     if include_languages and exclude_languages:
         raise ValueError("Cannot specify both include_languages and exclude_languages")
     
+    # Set membership instead of scanning the criteria list for every post
     if include_languages:
-        return [post for post in posts if post.language in include_languages]
+        include = frozenset(include_languages)
+        return [post for post in posts if post.language in include]
     
     if exclude_languages:
-        return [post for post in posts if post.language not in exclude_languages]
+        exclude = frozenset(exclude_languages)
+        return [post for post in posts if post.language not in exclude]
     
     # No filtering criteria specified, return all posts
     return posts
@@ -81,13 +85,8 @@ def get_language_statistics(posts: List[BlueskyPost]) -> Dict[str, int]:
     Returns:
         Dictionary mapping language types to counts
     """
-    stats = {}
-    
-    for post in posts:
-        language = post.language.value if hasattr(post.language, 'value') else str(post.language)
-        stats[language] = stats.get(language, 0) + 1
-    
-    return stats
+    # LanguageType is a str enum, so str() gives the value for enum members and plain strings alike
+    return dict(Counter(str(post.language) for post in posts))
 
 
 class PostLanguageFilter:
@@ -139,36 +138,42 @@ class PostLanguageFilter:
         if not posts:
             return []
         
-        filtered = posts
-        
-        # Apply language filtering
-        if self.include_languages:
-            filtered = [post for post in filtered if post.language in self.include_languages]
-        elif self.exclude_languages:
-            filtered = [post for post in filtered if post.language not in self.exclude_languages]
-        
-        # Apply content length filtering
-        if self.min_content_length is not None:
-            filtered = [post for post in filtered if len(post.content) >= self.min_content_length]
-        
-        if self.max_content_length is not None:
-            filtered = [post for post in filtered if len(post.content) <= self.max_content_length]
+        # Resolve the criteria once, then check each post in a single pass
+        include = set(self.include_languages) if self.include_languages else None
+        exclude = set(self.exclude_languages) if self.exclude_languages else None
+        min_length = self.min_content_length
+        max_length = self.max_content_length
+        require_links = self.require_links
+        require_tags = self.require_tags
         
-        # Apply link requirement filtering
-        if self.require_links is not None:
-            if self.require_links:
-                filtered = [post for post in filtered if len(post.links) > 0]
-            else:
-                filtered = [post for post in filtered if len(post.links) == 0]
+        if (include is None and exclude is None and min_length is None and max_length is None
+                and require_links is None and require_tags is None):
+            return posts
         
-        # Apply tag requirement filtering
-        if self.require_tags is not None:
-            if self.require_tags:
-                filtered = [post for post in filtered if len(post.tags) > 0]
-            else:
-                filtered = [post for post in filtered if len(post.tags) == 0]
+        def keep(post: BlueskyPost) -> bool:
+            # Cheapest checks first
+            if include is not None:
+                if post.language not in include:
+                    return False
+            elif exclude is not None and post.language in exclude:
+                return False
+            
+            if min_length is not None or max_length is not None:
+                content_length = len(post.content)
+                if min_length is not None and content_length < min_length:
+                    return False
+                if max_length is not None and content_length > max_length:
+                    return False
+            
+            if require_links is not None and bool(post.links) != require_links:
+                return False
+            
+            if require_tags is not None and bool(post.tags) != require_tags:
+                return False
+            
+            return True
         
-        return filtered
+        return [post for post in posts if keep(post)]
     
     def filter_and_report(self, posts: List[BlueskyPost]) -> FilterResult:
         """
@@ -6,7 +6,10 @@ to identify posts containing significant amounts of non-Latin characters.
 """
 
 import unicodedata
+from array import array
+from bisect import bisect_right
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -21,6 +24,13 @@ class LanguageType(str, Enum):
         return self.value
 
 
+# Members bound once at module level; the detection functions return these
+# instead of looking them up on the Enum class on every call
+_LATIN = LanguageType.LATIN
+_MIXED = LanguageType.MIXED
+_UNKNOWN = LanguageType.UNKNOWN
+
+
 # Latin Unicode ranges for character classification
 LATIN_RANGES = [
     # Basic Latin
@@ -60,6 +70,32 @@ NEUTRAL_RANGES = [
 ]
 
 
+def _range_endpoints(ranges: list[tuple[int, int]]) -> array:
+    """
+    Flatten inclusive ranges into sorted [start, end + 1, ...] endpoints.
+    
+    A code point lies inside one of the ranges exactly when bisect_right over
+    the endpoints returns an odd index. Adjacent ranges are merged.
+    """
+    endpoints = array('i')
+    for start, end in sorted(ranges):
+        if endpoints and endpoints[-1] >= start:
+            endpoints[-1] = max(endpoints[-1], end + 1)
+        else:
+            endpoints.extend((start, end + 1))
+    return endpoints
+
+
+_LATIN_ENDPOINTS = _range_endpoints(LATIN_RANGES)
+_NEUTRAL_ENDPOINTS = _range_endpoints(NEUTRAL_RANGES)
+
+# Whether each ASCII character is neutral by Unicode category (punctuation,
+# separator or symbol), so ASCII never needs a unicodedata.category call
+_ASCII_NEUTRAL = bytes(
+    unicodedata.category(chr(code_point))[0] in 'PZS' for code_point in range(0x80)
+)
+
+
 def is_latin_character(char: str) -> bool:
     """
     Check if a character belongs to Latin Unicode ranges.
@@ -75,12 +111,12 @@ def is_latin_character(char: str) -> bool:
     
     code_point = ord(char)
     
-    # Check Latin ranges
-    for start, end in LATIN_RANGES:
-        if start <= code_point <= end:
-            return True
+    # ASCII dominates post text and is always Latin
+    if code_point < 0x80:
+        return True
     
-    return False
+    # Binary search over the Latin range endpoints
+    return bool(bisect_right(_LATIN_ENDPOINTS, code_point) & 1)
 
 
 def is_neutral_character(char: str) -> bool:
@@ -98,10 +134,13 @@ def is_neutral_character(char: str) -> bool:
     
     code_point = ord(char)
     
+    # ASCII is outside the neutral ranges; its category is precomputed
+    if code_point < 0x80:
+        return bool(_ASCII_NEUTRAL[code_point])
+    
     # Check neutral ranges (punctuation, symbols, etc.)
-    for start, end in NEUTRAL_RANGES:
-        if start <= code_point <= end:
-            return True
+    if bisect_right(_NEUTRAL_ENDPOINTS, code_point) & 1:
+        return True
     
     # Also treat ASCII punctuation and whitespace as neutral
     category = unicodedata.category(char)
@@ -111,6 +150,93 @@ def is_neutral_character(char: str) -> bool:
     return False
 
 
+# Character classes used by the text analysis loops
+_CLASS_NON_LATIN = 0
+_CLASS_LATIN = 1
+_CLASS_NEUTRAL = 2
+_CLASS_SKIP = 3  # whitespace and control characters, ignored in percentages
+
+
+@lru_cache(maxsize=2048)
+def _classify_code_point(code_point: int) -> int:
+    """
+    Classify one code point, in the same precedence the analysis loops use.
+    
+    Cached because posts repeat the same few characters above the BMP table
+    (mostly emoji) many times.
+    """
+    char = chr(code_point)
+    if char.isspace() or unicodedata.category(char) in ('Cc', 'Cf'):
+        return _CLASS_SKIP
+    if is_latin_character(char):
+        return _CLASS_LATIN
+    if is_neutral_character(char):
+        return _CLASS_NEUTRAL
+    return _CLASS_NON_LATIN
+
+
+def _build_bmp_classes() -> bytes:
+    """
+    Build the class of every Basic Multilingual Plane code point.
+    
+    Fills whole ranges at a time, applying classes from lowest to highest
+    precedence, so it matches _classify_code_point without calling it 65536 times.
+    """
+    size = 0x10000
+    classes = bytearray(size)  # _CLASS_NON_LATIN everywhere to start
+    
+    for start, end in NEUTRAL_RANGES:
+        if start < size:
+            stop = min(end, size - 1) + 1
+            classes[start:stop] = bytes([_CLASS_NEUTRAL]) * (stop - start)
+    
+    chars = [chr(code_point) for code_point in range(size)]
+    categories = [unicodedata.category(char) for char in chars]
+    for code_point, category in enumerate(categories):
+        if category[0] in 'PZS':
+            classes[code_point] = _CLASS_NEUTRAL
+    
+    for start, end in LATIN_RANGES:
+        if start < size:
+            stop = min(end, size - 1) + 1
+            classes[start:stop] = bytes([_CLASS_LATIN]) * (stop - start)
+    
+    for code_point, (char, category) in enumerate(zip(chars, categories)):
+        if char.isspace() or category in ('Cc', 'Cf'):
+            classes[code_point] = _CLASS_SKIP
+    
+    return bytes(classes)
+
+
+# Precomputed classes for the Basic Multilingual Plane, indexed by code point;
+# characters above it are rare in posts and are classified on the fly
+_BMP_CLASSES = _build_bmp_classes()
+
+# The same table as a str.translate table mapping each BMP character to its class
+# character '\x00'..'\x03'; characters above the BMP fall outside it and stay unchanged
+_CLASS_TRANSLATION = _BMP_CLASSES.decode('latin-1')
+
+
+def _count_classes(text: str) -> list[int]:
+    """
+    Count the characters of each class in text, indexed by class.
+    
+    Classification and counting run as C-level string operations (translate
+    and count) instead of a Python loop over characters.
+    """
+    classified = text.translate(_CLASS_TRANSLATION)
+    counts = [classified.count(class_char) for class_char in '\x00\x01\x02\x03']
+    
+    # Only characters above the BMP survive translate as non-ASCII; walk them
+    # as UTF-32 code units so no one-character strings are created along the way
+    if not classified.isascii():
+        for code_point in memoryview(classified.encode('utf-32-le')).cast('I'):
+            if code_point >= 0x10000:
+                counts[_classify_code_point(code_point)] += 1
+    
+    return counts
+
+
 def calculate_non_latin_percentage(text: str) -> float:
     """
     Calculate the percentage of non-Latin characters in text.
@@ -124,19 +250,11 @@ def calculate_non_latin_percentage(text: str) -> float:
     if not text or not text.strip():
         return 0.0
     
-    total_chars = 0
-    non_latin_chars = 0
+    counts = _count_classes(text)
     
-    for char in text:
-        # Skip whitespace and control characters for meaningful analysis
-        if char.isspace() or unicodedata.category(char) in ('Cc', 'Cf'):
-            continue
-        
-        total_chars += 1
-        
-        # Count characters that are neither Latin nor neutral as non-Latin
-        if not is_latin_character(char) and not is_neutral_character(char):
-            non_latin_chars += 1
+    # Whitespace and control characters are left out of the total
+    non_latin_chars = counts[_CLASS_NON_LATIN]
+    total_chars = non_latin_chars + counts[_CLASS_LATIN] + counts[_CLASS_NEUTRAL]
     
     if total_chars == 0:
         return 0.0
@@ -144,6 +262,21 @@ def calculate_non_latin_percentage(text: str) -> float:
     return non_latin_chars / total_chars
 
 
+def _language_type_for_percentage(
+    non_latin_percentage: float,
+    threshold: float = 0.3,
+    mixed_threshold: float = 0.7
+) -> LanguageType:
+    """Map a non-Latin percentage to its LanguageType using the detection thresholds."""
+    if non_latin_percentage < threshold:
+        return _LATIN
+    elif non_latin_percentage < mixed_threshold:
+        return _MIXED
+    else:
+        return _UNKNOWN
+
+
+@lru_cache(maxsize=4096)
 def detect_language_from_text(
     text: str, 
     threshold: float = 0.3, 
@@ -152,6 +285,9 @@ def detect_language_from_text(
     """
     Detect language type based on character analysis.
     
+    Results are cached by (text, thresholds), since the same post content is
+    classified again whenever a post model is rebuilt without its language.
+    
     Args:
         text: Text content to analyze
         threshold: Threshold for considering text as mixed (default 30%)
@@ -161,16 +297,11 @@ def detect_language_from_text(
         LanguageType enum value (latin, mixed, or unknown)
     """
     if not text or not text.strip():
-        return LanguageType.LATIN
+        return _LATIN
     
     non_latin_percentage = calculate_non_latin_percentage(text)
     
-    if non_latin_percentage < threshold:
-        return LanguageType.LATIN
-    elif non_latin_percentage < mixed_threshold:
-        return LanguageType.MIXED
-    else:
-        return LanguageType.UNKNOWN
+    return _language_type_for_percentage(non_latin_percentage, threshold, mixed_threshold)
 
 
 def analyze_text_characters(text: str) -> dict:
@@ -192,24 +323,15 @@ def analyze_text_characters(text: str) -> dict:
             "whitespace_chars": 0,
             "meaningful_chars": 0,
             "non_latin_percentage": 0.0,
-            "language_type": LanguageType.LATIN
+            "language_type": _LATIN
         }
     
     total_chars = len(text)
-    latin_chars = 0
-    non_latin_chars = 0
-    neutral_chars = 0
-    whitespace_chars = 0
-    
-    for char in text:
-        if char.isspace() or unicodedata.category(char) in ('Cc', 'Cf'):
-            whitespace_chars += 1
-        elif is_latin_character(char):
-            latin_chars += 1
-        elif is_neutral_character(char):
-            neutral_chars += 1
-        else:
-            non_latin_chars += 1
+    counts = _count_classes(text)
+    latin_chars = counts[_CLASS_LATIN]
+    non_latin_chars = counts[_CLASS_NON_LATIN]
+    neutral_chars = counts[_CLASS_NEUTRAL]
+    whitespace_chars = counts[_CLASS_SKIP]
     
     meaningful_chars = total_chars - whitespace_chars
     non_latin_percentage = (
@@ -224,7 +346,8 @@ def analyze_text_characters(text: str) -> dict:
         "whitespace_chars": whitespace_chars,
         "meaningful_chars": meaningful_chars,
         "non_latin_percentage": non_latin_percentage,
-        "language_type": detect_language_from_text(text)
+        # Same percentage detect_language_from_text computes, so reuse it
+        "language_type": _language_type_for_percentage(non_latin_percentage)
     }
 
 
@@ -238,25 +361,32 @@ def get_character_sample(text: str, char_type: str = "non_latin", limit: int = 1
         limit: Maximum number of characters to return
         
     Returns:
-        List of sample characters
+        List of distinct sample characters, in order of first appearance
     """
     if not text:
         return []
     
-    samples = []
+    # Dict as an ordered set: each character is classified once, and the scan
+    # stops as soon as limit distinct samples are found
+    samples: dict[str, None] = {}
+    seen = set()
     
     for char in text:
         if len(samples) >= limit:
             break
         
+        if char in seen:
+            continue
+        seen.add(char)
+        
         if char.isspace() or unicodedata.category(char) in ('Cc', 'Cf'):
             continue
         
         if char_type == "latin" and is_latin_character(char):
-            samples.append(char)
+            samples[char] = None
         elif char_type == "non_latin" and not is_latin_character(char) and not is_neutral_character(char):
-            samples.append(char)
+            samples[char] = None
         elif char_type == "neutral" and is_neutral_character(char):
-            samples.append(char)
+            samples[char] = None
     
-    return list(set(samples))  # Remove duplicates while preserving order
\ No newline at end of file
+    return list(samples)
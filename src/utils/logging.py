@@ -2,6 +2,14 @@ import logging
 import sys
 from functools import cache
 
+# One formatter shared by every handler this module creates. datefmt has no
+# fractional seconds, so formatTime does a single strftime and no msec formatting.
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_FORMATTER.default_msec_format = None
+
 
 @cache
 def get_logger(name: str, level: str | None = None) -> logging.Logger:
@@ -36,12 +44,7 @@ def get_logger(name: str, level: str | None = None) -> logging.Logger:
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(getattr(logging, level.upper()))
 
-        # Create formatter
-        formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
 
         # Add handler to logger
         logger.addHandler(handler)
@@ -69,11 +72,7 @@ def setup_logging(level: str | None = None) -> None:
 
     # Add console handler to root
     handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
     root_logger.addHandler(handler)
 
     # Configure specific loggers to reduce noise
@@ -2,6 +2,10 @@
 
 import asyncio
 import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
 from typing import Optional, Set
 from urllib.parse import urlparse
 
@@ -11,13 +15,28 @@ from pydantic import HttpUrl
 logger = logging.getLogger(__name__)
 
 # Common URL shortener domains
-SHORTENER_DOMAINS = {
+SHORTENER_DOMAINS = frozenset({
     "bit.ly", "bitly.com", "tinyurl.com", "t.co", "goo.gl", "ow.ly",
     "short.link", "tiny.cc", "is.gd", "buff.ly", "ift.tt", "dlvr.it",
     "fb.me", "amzn.to", "youtu.be", "linkedin.com/posts", "lnkd.in",
     "rebrand.ly", "cutt.ly", "bl.ink", "short.lnk", "v.gd", "x.co",
     "po.st", "shor.by", "switchy.io", "smallseotools.com"
-}
+})
+
+# Expanded URLs persisted across runs are trusted for this long
+PERSISTENT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Persisted expansions are committed in batches of this many writes
+PERSISTENT_CACHE_COMMIT_EVERY = 50
+
+# Network location of a URL (what urlparse reports as netloc), without a full parse
+_NETLOC_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
+
+def _netloc(url: str) -> str:
+    """Lowercased network location of a URL, or '' if it has none."""
+    match = _NETLOC_RE.match(url)
+    return match.group(1).lower() if match else ""
 
 
 class URLExpander:
@@ -27,7 +46,10 @@ class URLExpander:
         self,
         timeout: float = 10.0,
         max_redirects: int = 10,
-        user_agent: str = "Mozilla/5.0 (compatible; URLExpander/1.0)"
+        user_agent: str = "Mozilla/5.0 (compatible; URLExpander/1.0)",
+        cache_path: Optional[Path] = None,
+        cache_ttl: int = PERSISTENT_CACHE_TTL_SECONDS,
+        max_concurrent: int = 20
     ):
         """
         Initialize URL expander.
@@ -36,25 +58,100 @@ class URLExpander:
             timeout: Request timeout in seconds
             max_redirects: Maximum number of redirects to follow
             user_agent: User agent string for requests
+            cache_path: SQLite file to persist expanded URLs across runs (in-memory only if None)
+            cache_ttl: Seconds a persisted expansion stays valid
+            max_concurrent: Maximum number of URLs being resolved over HTTP at once
         """
         self.timeout = timeout
         self.max_redirects = max_redirects
         self.user_agent = user_agent
+        self.cache_ttl = cache_ttl
+        self.max_concurrent = max_concurrent
+        
+        # Bounds in-flight redirect lookups to what the connection pool can serve
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         
         # Cache for expanded URLs to avoid repeated requests
         self._cache: dict[str, str] = {}
         
+        # Optional on-disk cache of successful expansions, shared between runs
+        self._persistent_cache: Optional[sqlite3.Connection] = None
+        self._uncommitted_writes = 0
+        if cache_path is not None:
+            self._persistent_cache = self._open_persistent_cache(cache_path)
+        
         # Create HTTP client
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
             headers={"User-Agent": user_agent},
             follow_redirects=False,  # We'll handle redirects manually
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            limits=httpx.Limits(
+                max_keepalive_connections=max_concurrent,
+                max_connections=max_concurrent
+            )
         )
     
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and flush the persistent cache."""
         await self.client.aclose()
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to save URL expansion cache: {e}")
+            self._persistent_cache.close()
+            self._persistent_cache = None
+    
+    def _open_persistent_cache(self, cache_path: Path) -> Optional[sqlite3.Connection]:
+        """
+        Open the SQLite expansion cache, creating it if needed and dropping expired entries.
+        
+        Args:
+            cache_path: Path to the SQLite file
+            
+        Returns:
+            Open connection, or None if the cache cannot be used
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(cache_path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS expanded_urls "
+                "(url TEXT PRIMARY KEY, final_url TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute("DELETE FROM expanded_urls WHERE expires_at <= ?", (time.time(),))
+            connection.commit()
+            return connection
+        except sqlite3.Error as e:
+            logger.warning(f"URL expansion cache unavailable at {cache_path}: {e}")
+            return None
+    
+    def _get_persisted(self, url: str) -> Optional[str]:
+        """Look up an unexpired expansion from a previous run; cache errors count as a miss."""
+        try:
+            row = self._persistent_cache.execute(
+                "SELECT final_url FROM expanded_urls WHERE url = ? AND expires_at > ?",
+                (url, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"URL expansion cache lookup failed for {url}: {e}")
+            return None
+        return row[0] if row else None
+    
+    def _persist(self, url: str, final_url: str) -> None:
+        """Store a successful expansion for later runs; cache errors skip the write."""
+        try:
+            self._persistent_cache.execute(
+                "INSERT OR REPLACE INTO expanded_urls (url, final_url, expires_at) VALUES (?, ?, ?)",
+                (url, final_url, time.time() + self.cache_ttl)
+            )
+            self._uncommitted_writes += 1
+            # Commit periodically so a crashed run keeps most of its expansions
+            if self._uncommitted_writes >= PERSISTENT_CACHE_COMMIT_EVERY:
+                self._persistent_cache.commit()
+                self._uncommitted_writes = 0
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist expansion of {url}: {e}")
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -74,17 +171,15 @@ class URLExpander:
         Returns:
             True if URL appears to be shortened
         """
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove www. prefix if present
-            if domain.startswith("www."):
-                domain = domain[4:]
-            
-            return domain in SHORTENER_DOMAINS
-        except Exception:
+        domain = _netloc(url)
+        if not domain:
             return False
+        
+        # Remove www. prefix if present
+        if domain.startswith("www."):
+            domain = domain[4:]
+        
+        return domain in SHORTENER_DOMAINS
     
     async def expand_url(self, url: str) -> str:
         """
@@ -105,9 +200,20 @@ class URLExpander:
             self._cache[url] = url
             return url
         
+        # Then expansions persisted by earlier runs
+        if self._persistent_cache is not None:
+            persisted_url = self._get_persisted(url)
+            if persisted_url is not None:
+                self._cache[url] = persisted_url
+                return persisted_url
+        
         try:
-            final_url = await self._follow_redirects(url)
+            async with self._semaphore:
+                final_url, resolved = await self._follow_redirects(url)
             self._cache[url] = final_url
+            # Only complete resolutions outlive this run; errors are retried next time
+            if resolved and self._persistent_cache is not None:
+                self._persist(url, final_url)
             logger.debug(f"Expanded {url} -> {final_url}")
             return final_url
         except Exception as e:
@@ -116,7 +222,7 @@ class URLExpander:
             self._cache[url] = url
             return url
     
-    async def _follow_redirects(self, url: str) -> str:
+    async def _follow_redirects(self, url: str) -> tuple[str, bool]:
         """
         Follow redirects to find the final URL.
         
@@ -124,10 +230,13 @@ class URLExpander:
             url: Starting URL
             
         Returns:
-            Final URL after following redirects
+            Tuple of (final URL after following redirects, whether the chain ended
+            in a 2xx response rather than an error status, a failed request, a
+            redirect without location, or the redirect limit)
         """
         current_url = url
         redirect_count = 0
+        resolved = False
         
         while redirect_count < self.max_redirects:
             try:
@@ -155,7 +264,8 @@ class URLExpander:
                     redirect_count += 1
                     logger.debug(f"Redirect {redirect_count}: {current_url}")
                 else:
-                    # No more redirects
+                    # No more redirects; only a successful response is a real destination
+                    resolved = 200 <= response.status_code < 300
                     break
                     
             except httpx.HTTPStatusError:
@@ -172,6 +282,8 @@ class URLExpander:
                             current_url = location
                             redirect_count += 1
                             continue
+                    else:
+                        resolved = 200 <= response.status_code < 300
                 except Exception:
                     break
                 break
@@ -182,7 +294,7 @@ class URLExpander:
         if redirect_count >= self.max_redirects:
             logger.warning(f"Maximum redirects ({self.max_redirects}) reached for {url}")
         
-        return current_url
+        return current_url, resolved
     
     async def expand_urls(self, urls: list[str]) -> list[str]:
         """
@@ -197,18 +309,22 @@ class URLExpander:
         if not urls:
             return []
         
+        # Dispatch URLs grouped by host so requests to the same host run
+        # back-to-back and reuse pooled keep-alive connections
+        order = sorted(range(len(urls)), key=lambda i: _netloc(urls[i]))
+        
         # Expand URLs concurrently
-        tasks = [self.expand_url(url) for url in urls]
+        tasks = [self.expand_url(urls[i]) for i in order]
         expanded = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Handle any exceptions
-        results = []
-        for i, result in enumerate(expanded):
+        # Handle any exceptions, restoring the input order
+        results = [None] * len(urls)
+        for i, result in zip(order, expanded):
             if isinstance(result, Exception):
                 logger.warning(f"Failed to expand URL {urls[i]}: {result}")
-                results.append(urls[i])  # Use original URL
+                results[i] = urls[i]  # Use original URL
             else:
-                results.append(result)
+                results[i] = result
         
         return results
 
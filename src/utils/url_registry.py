@@ -1,13 +1,24 @@
 """URL registry utilities for managing URL tracking."""
 
 from datetime import datetime
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import pandas as pd
 from pydantic import HttpUrl
 
 from src.models.url_registry import URLEntry
 
+# Text columns kept as Arrow-backed strings: contiguous buffers instead of one
+# Python object per cell, and comparisons run in Arrow compute kernels
+_STRING_COLUMNS = ('url', 'first_post_id', 'first_post_author')
+_STRING_DTYPE = 'string[pyarrow]'
+
+# Columns written when a URL is marked evaluated, in mark_evaluated_bulk's value order
+_EVALUATION_COLUMNS = ['evaluated', 'evaluated_at', 'is_mcp_related', 'relevance_score', 'last_updated']
+
+# Third '/'-separated part of a URL containing '://', i.e. its host, as in url.split('/')[2]
+_DOMAIN_PATTERN = r'^(?=.*://)[^/]*/[^/]*/([^/]*)'
+
 
 def normalize_url(url: str | HttpUrl) -> str:
     """Normalize URL for consistent comparison."""
@@ -23,6 +34,13 @@ class URLRegistry:
     
     def __init__(self, df: Optional[pd.DataFrame] = None):
         """Initialize registry with optional existing DataFrame."""
+        # New entries are buffered as dicts and only concatenated into the
+        # DataFrame when it is read, so adding N URLs is not O(N^2)
+        self._pending: list[dict] = []
+        self._pending_by_url: dict[str, dict] = {}
+        # Normalized URL -> index label of its row in the flushed DataFrame
+        self._url_index: dict[str, int] = {}
+        
         if df is None:
             self.df = pd.DataFrame(columns=[
                 'url', 'first_seen', 'published_date', 
@@ -40,21 +58,66 @@ class URLRegistry:
                     else:
                         self.df[col] = None
         
-        # Ensure URL column is string type for indexing
+        # Ensure URL and other text columns are string type for indexing
         if not self.df.empty:
-            self.df['url'] = self.df['url'].astype(str)
+            self._convert_string_columns()
+            self._rebuild_url_index()
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """Registry DataFrame, including any entries added since it was last read."""
+        self._flush()
+        return self._df
+    
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+        self._rebuild_url_index()
+    
+    def _convert_string_columns(self) -> None:
+        """Store the text columns as Arrow-backed strings."""
+        for col in _STRING_COLUMNS:
+            if col in self._df.columns and self._df[col].dtype != _STRING_DTYPE:
+                self._df[col] = self._df[col].astype(_STRING_DTYPE)
+    
+    def _rebuild_url_index(self) -> None:
+        """Map each URL to its row label; the first row wins if a URL is duplicated."""
+        urls = self._df['url'].tolist()
+        labels = self._df.index.tolist()
+        self._url_index = dict(zip(reversed(urls), reversed(labels)))
+    
+    def _flush(self) -> None:
+        """Append buffered new entries to the DataFrame in one concat."""
+        if not self._pending:
+            return
+        
+        new_rows = pd.DataFrame(self._pending)
+        self._df = pd.concat([self._df, new_rows], ignore_index=True)
+        # Ensure text columns remain string type
+        self._convert_string_columns()
+        self._rebuild_url_index()
+        
+        self._pending = []
+        self._pending_by_url = {}
     
     def add_url(self, url: str | HttpUrl, post_id: str, author: str) -> bool:
         """Add URL to registry or increment times_seen. Returns True if new URL."""
         url_str = normalize_url(url)
         now = datetime.now()
         
+        # Check if URL is waiting to be flushed
+        pending_entry = self._pending_by_url.get(url_str)
+        if pending_entry is not None:
+            pending_entry['times_seen'] += 1
+            pending_entry['last_updated'] = now
+            return False
+        
         # Check if URL exists
-        if not self.df.empty and (self.df['url'] == url_str).any():
+        idx = self._url_index.get(url_str)
+        if idx is not None:
             # Update existing entry
-            idx = self.df[self.df['url'] == url_str].index[0]
-            self.df.at[idx, 'times_seen'] += 1
-            self.df.at[idx, 'last_updated'] = now
+            self._df.at[idx, 'times_seen'] += 1
+            self._df.at[idx, 'last_updated'] = now
             return False
         else:
             # Add new entry - use original URL for storage
@@ -70,28 +133,25 @@ class URLRegistry:
             entry_dict = new_entry.model_dump()
             entry_dict['url'] = url_str  # Store normalized URL
             
-            new_row = pd.DataFrame([entry_dict])
-            self.df = pd.concat([self.df, new_row], ignore_index=True)
-            # Ensure URL column remains string type
-            self.df['url'] = self.df['url'].astype(str)
+            self._pending.append(entry_dict)
+            self._pending_by_url[url_str] = entry_dict
             return True
     
     def contains_url(self, url: str | HttpUrl) -> bool:
         """Check if URL exists in registry."""
         url_str = normalize_url(url)
-        if self.df.empty:
-            return False
-        return bool((self.df['url'] == url_str).any())
+        return url_str in self._url_index or url_str in self._pending_by_url
     
     def is_evaluated(self, url: str | HttpUrl) -> bool:
         """Check if URL has been evaluated."""
         url_str = normalize_url(url)
-        if self.df.empty:
-            return False
+        pending_entry = self._pending_by_url.get(url_str)
+        if pending_entry is not None:
+            return bool(pending_entry['evaluated'])
         
-        mask = self.df['url'] == url_str
-        if mask.any():
-            return bool(self.df.loc[mask, 'evaluated'].iloc[0])
+        idx = self._url_index.get(url_str)
+        if idx is not None:
+            return bool(self._df.at[idx, 'evaluated'])
         return False
     
     def mark_evaluated(
@@ -101,16 +161,41 @@ class URLRegistry:
         relevance_score: float
     ) -> None:
         """Mark URL as evaluated with results."""
-        url_str = normalize_url(url)
+        self.mark_evaluated_bulk([(url, is_mcp_related, relevance_score)])
+    
+    def mark_evaluated_bulk(
+        self,
+        updates: list[tuple[str | HttpUrl, bool, float]]
+    ) -> None:
+        """
+        Mark several URLs as evaluated in one DataFrame write.
+        
+        Args:
+            updates: (url, is_mcp_related, relevance_score) for each evaluated URL;
+                URLs not in the registry are ignored
+        """
         now = datetime.now()
+        labels = []
+        values = []
         
-        if not self.df.empty and (self.df['url'] == url_str).any():
-            idx = self.df[self.df['url'] == url_str].index[0]
-            self.df.at[idx, 'evaluated'] = True
-            self.df.at[idx, 'evaluated_at'] = now
-            self.df.at[idx, 'is_mcp_related'] = is_mcp_related
-            self.df.at[idx, 'relevance_score'] = relevance_score
-            self.df.at[idx, 'last_updated'] = now
+        for url, is_mcp_related, relevance_score in updates:
+            url_str = normalize_url(url)
+            
+            pending_entry = self._pending_by_url.get(url_str)
+            if pending_entry is not None:
+                pending_entry.update(
+                    evaluated=True,
+                    evaluated_at=now,
+                    is_mcp_related=is_mcp_related,
+                    relevance_score=relevance_score,
+                    last_updated=now
+                )
+            elif url_str in self._url_index:
+                labels.append(self._url_index[url_str])
+                values.append([True, now, is_mcp_related, relevance_score, now])
+        
+        if labels:
+            self._df.loc[labels, _EVALUATION_COLUMNS] = values
     
     def get_stats(self) -> dict:
         """Get registry statistics."""
@@ -124,29 +209,32 @@ class URLRegistry:
                 'avg_relevance_score': 0.0
             }
         
-        # Extract domains
-        domains = self.df['url'].apply(lambda x: x.split('/')[2] if '://' in x else '')
+        df = self.df
+        
+        # Extract domains (vectorized; URLs without a scheme count as domain '')
+        domains = df['url'].str.extract(_DOMAIN_PATTERN, expand=False).fillna('')
         
-        # Calculate evaluation stats
-        evaluated = self.df['evaluated'].sum()
-        mcp_related = self.df[self.df['is_mcp_related'] == True].shape[0]
-        avg_relevance = self.df[self.df['evaluated'] == True]['relevance_score'].mean()
+        # Calculate evaluation stats, scanning the evaluated column once
+        evaluated_mask = df['evaluated'] == True
+        evaluated = evaluated_mask.sum()
+        mcp_related = (df['is_mcp_related'] == True).sum()
+        avg_relevance = df.loc[evaluated_mask, 'relevance_score'].mean()
         
         return {
-            'total_urls': len(self.df),
-            'total_occurrences': self.df['times_seen'].sum(),
+            'total_urls': len(df),
+            'total_occurrences': df['times_seen'].sum(),
             'unique_domains': domains.nunique(),
             'evaluated_urls': int(evaluated),
             'mcp_related_urls': int(mcp_related),
             'avg_relevance_score': float(avg_relevance) if not pd.isna(avg_relevance) else 0.0
         }
     
-    def to_parquet(self, path: str) -> None:
-        """Save registry to Parquet file."""
+    def to_parquet(self, path: str | BinaryIO) -> None:
+        """Save registry to a Parquet file path or binary file-like object."""
         self.df.to_parquet(path, index=False)
     
     @classmethod
-    def from_parquet(cls, path: str) -> 'URLRegistry':
-        """Load registry from Parquet file."""
+    def from_parquet(cls, path: str | BinaryIO) -> 'URLRegistry':
+        """Load registry from a Parquet file path or binary file-like object."""
         df = pd.read_parquet(path)
         return cls(df)
\ No newline at end of file
@@ -0,0 +1,45 @@
+import pytest
+
+from src.config.settings import Settings
+from src.storage.r2_client import R2Client
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make asyncio.sleep return immediately so pagination/rate-limit pauses never slow tests."""
+
+    async def _instant(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr("asyncio.sleep", _instant)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_r2_clients():
+    """Drop R2 clients cached by R2Client.get so collector tests never share one."""
+    yield
+    R2Client.clear_instances()
+
+
+@pytest.fixture(scope="session")
+def mock_settings():
+    """Create mock settings with Bluesky credentials (shared, tests must not mutate it)."""
+    return Settings(
+        r2_access_key_id="test_key",
+        r2_secret_access_key="test_secret",
+        r2_bucket_name="test-bucket",
+        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
+        bluesky_handle="test.bsky.social",
+        bluesky_app_password="test-app-password",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_settings_no_credentials():
+    """Create mock settings without Bluesky credentials (shared, tests must not mutate it)."""
+    return Settings(
+        r2_access_key_id="test_key",
+        r2_secret_access_key="test_secret",
+        r2_bucket_name="test-bucket",
+        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
+    )
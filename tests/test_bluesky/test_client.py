@@ -2,47 +2,21 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from atproto import models
+from atproto import AsyncClient, models
 from atproto.exceptions import AtProtocolError
 
 from src.bluesky.client import BlueskyClient
-from src.config.settings import Settings
 from src.models.post import BlueskyPost
 
 
-@pytest.fixture
-def mock_settings():
-    """Create mock settings with Bluesky credentials."""
-    return Settings(
-        r2_access_key_id="test_key",
-        r2_secret_access_key="test_secret",
-        r2_bucket_name="test-bucket",
-        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
-        bluesky_handle="test.bsky.social",
-        bluesky_app_password="test-app-password",
-    )
-
-
-@pytest.fixture
-def mock_settings_no_credentials():
-    """Create mock settings without Bluesky credentials."""
-    return Settings(
-        r2_access_key_id="test_key",
-        r2_secret_access_key="test_secret",
-        r2_bucket_name="test-bucket",
-        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
-    )
-
-
 @pytest.fixture
 def bluesky_client(mock_settings):
     """Create BlueskyClient instance."""
     return BlueskyClient(mock_settings)
 
 
-@pytest.fixture
-def mock_post_data():
-    """Create mock atproto post data."""
+def _build_mock_post_data():
+    """Build a mock atproto feed view post."""
     # Create mock post record
     record = Mock()
     record.text = "Check out this MCP tool: https://example.com"
@@ -69,6 +43,32 @@ def mock_post_data():
     return feed_post
 
 
+# Attribute names of atproto's AsyncClient, introspected once and reused as the
+# spec for client mocks so typos fail loudly without re-introspecting per test
+_ASYNC_CLIENT_SPEC = dir(AsyncClient)
+
+
+def _make_authed_client(search_posts):
+    """Build a flat stand-in for an authenticated atproto client with the given search_posts mock."""
+    client = Mock(spec=_ASYNC_CLIENT_SPEC)
+    # app is set per instance by AsyncClient.__init__, so it is not in the class spec
+    client.app = Mock()
+    client.app.bsky.feed.search_posts = search_posts
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_post_data():
+    """Create mock atproto post data, built once and shared by tests that only read it."""
+    return _build_mock_post_data()
+
+
+@pytest.fixture
+def mock_post_data_mutable():
+    """Create fresh mock atproto post data for tests that modify it."""
+    return _build_mock_post_data()
+
+
 class TestBlueskyClientInit:
     def test_init_with_settings(self, mock_settings):
         """Test BlueskyClient initialization."""
@@ -85,11 +85,10 @@ class TestBlueskyClientInit:
 
 
 class TestBlueskyClientAuthentication:
-    @pytest.mark.asyncio
     async def test_authenticate_success(self, bluesky_client):
         """Test successful authentication."""
         with patch("src.bluesky.client.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
+            mock_client = AsyncMock(spec=AsyncClient)
             mock_client_class.return_value = mock_client
 
             result = await bluesky_client.authenticate()
@@ -101,7 +100,6 @@ class TestBlueskyClientAuthentication:
                 "test.bsky.social", "test-app-password"
             )
 
-    @pytest.mark.asyncio
     async def test_authenticate_no_credentials(self, mock_settings_no_credentials):
         """Test authentication fails without credentials."""
         client = BlueskyClient(mock_settings_no_credentials)
@@ -112,11 +110,10 @@ class TestBlueskyClientAuthentication:
         assert client.client is None
         assert not client._session_active
 
-    @pytest.mark.asyncio
     async def test_authenticate_api_error(self, bluesky_client):
         """Test authentication fails with API error."""
         with patch("src.bluesky.client.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
+            mock_client = AsyncMock(spec=AsyncClient)
             mock_client.login.side_effect = AtProtocolError("Invalid credentials")
             mock_client_class.return_value = mock_client
 
@@ -125,7 +122,6 @@ class TestBlueskyClientAuthentication:
             assert result is False
             assert not bluesky_client._session_active
 
-    @pytest.mark.asyncio
     async def test_authenticate_unexpected_error(self, bluesky_client):
         """Test authentication fails with unexpected error."""
         with patch("src.bluesky.client.AsyncClient") as mock_client_class:
@@ -136,7 +132,6 @@ class TestBlueskyClientAuthentication:
             assert result is False
             assert not bluesky_client._session_active
 
-    @pytest.mark.asyncio
     async def test_close(self, bluesky_client):
         """Test closing client session."""
         # Set up authenticated client
@@ -148,7 +143,6 @@ class TestBlueskyClientAuthentication:
         assert not bluesky_client._session_active
         bluesky_client.client.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_close_no_client(self, bluesky_client):
         """Test closing when no client exists."""
         await bluesky_client.close()  # Should not raise error
@@ -156,7 +150,6 @@ class TestBlueskyClientAuthentication:
 
 
 class TestBlueskyClientContextManager:
-    @pytest.mark.asyncio
     async def test_async_context_manager_success(self, bluesky_client):
         """Test async context manager with successful auth."""
         with patch.object(
@@ -168,7 +161,6 @@ class TestBlueskyClientContextManager:
             mock_auth.assert_called_once()
             mock_close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_context_manager_with_exception(self, bluesky_client):
         """Test async context manager cleanup on exception."""
         with patch.object(bluesky_client, "authenticate", return_value=True):
@@ -198,41 +190,39 @@ class TestBlueskyClientPostConversion:
         assert result.engagement_metrics.reposts == 2
         assert result.engagement_metrics.replies == 1
 
-    def test_convert_post_missing_engagement(self, bluesky_client, mock_post_data):
+    def test_convert_post_missing_engagement(self, bluesky_client, mock_post_data_mutable):
         """Test converting post with missing engagement metrics."""
         # Remove engagement metrics
-        del mock_post_data.post.like_count
-        del mock_post_data.post.repost_count
-        del mock_post_data.post.reply_count
+        del mock_post_data_mutable.post.like_count
+        del mock_post_data_mutable.post.repost_count
+        del mock_post_data_mutable.post.reply_count
 
-        result = bluesky_client._convert_post_to_model(mock_post_data)
+        result = bluesky_client._convert_post_to_model(mock_post_data_mutable)
 
         assert result.engagement_metrics.likes == 0
         assert result.engagement_metrics.reposts == 0
         assert result.engagement_metrics.replies == 0
 
-    def test_convert_post_no_facets(self, bluesky_client, mock_post_data):
+    def test_convert_post_no_facets(self, bluesky_client, mock_post_data_mutable):
         """Test converting post without facets (no links)."""
-        mock_post_data.post.record.facets = None
+        mock_post_data_mutable.post.record.facets = None
 
-        result = bluesky_client._convert_post_to_model(mock_post_data)
+        result = bluesky_client._convert_post_to_model(mock_post_data_mutable)
 
         assert len(result.links) == 0
 
 
 class TestBlueskyClientSearch:
-    @pytest.mark.asyncio
     async def test_search_posts_success(self, bluesky_client, mock_post_data):
         """Test successful post search."""
         # Set up authenticated client
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         # Mock search response
         mock_response = Mock()
         mock_response.posts = [mock_post_data]
         mock_response.cursor = "next_cursor_123"
-        bluesky_client.client.app.bsky.feed.search_posts.return_value = mock_response
+        bluesky_client.client = _make_authed_client(AsyncMock(return_value=mock_response))
 
         posts, cursor = await bluesky_client.search_posts("mcp", limit=10)
 
@@ -244,19 +234,16 @@ class TestBlueskyClientSearch:
             params={"q": "mcp", "limit": 10, "cursor": None}
         )
 
-    @pytest.mark.asyncio
     async def test_search_posts_not_authenticated(self, bluesky_client):
         """Test search fails when not authenticated."""
         with pytest.raises(RuntimeError, match="Client not authenticated"):
             await bluesky_client.search_posts("mcp")
 
-    @pytest.mark.asyncio
     async def test_search_posts_api_error(self, bluesky_client):
         """Test search handles API error gracefully."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
-        bluesky_client.client.app.bsky.feed.search_posts.side_effect = AtProtocolError(
-            "API error"
+        bluesky_client.client = _make_authed_client(
+            AsyncMock(side_effect=AtProtocolError("API error"))
         )
 
         posts, cursor = await bluesky_client.search_posts("mcp")
@@ -264,10 +251,8 @@ class TestBlueskyClientSearch:
         assert posts == []
         assert cursor is None
 
-    @pytest.mark.asyncio
     async def test_search_posts_conversion_error(self, bluesky_client, mock_post_data):
         """Test search handles post conversion errors gracefully."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         # Create invalid post data that will cause conversion error
@@ -277,7 +262,7 @@ class TestBlueskyClientSearch:
         mock_response = Mock()
         mock_response.posts = [mock_post_data, invalid_post]  # One valid, one invalid
         mock_response.cursor = None
-        bluesky_client.client.app.bsky.feed.search_posts.return_value = mock_response
+        bluesky_client.client = _make_authed_client(AsyncMock(return_value=mock_response))
 
         posts, cursor = await bluesky_client.search_posts("mcp")
 
@@ -285,16 +270,14 @@ class TestBlueskyClientSearch:
         assert len(posts) == 1
         assert isinstance(posts[0], BlueskyPost)
 
-    @pytest.mark.asyncio
     async def test_search_mcp_mentions(self, bluesky_client, mock_post_data):
         """Test MCP-specific search."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         mock_response = Mock()
         mock_response.posts = [mock_post_data]
         mock_response.cursor = None
-        bluesky_client.client.app.bsky.feed.search_posts.return_value = mock_response
+        bluesky_client.client = _make_authed_client(AsyncMock(return_value=mock_response))
 
         posts, cursor = await bluesky_client.search_mcp_mentions(limit=5)
 
@@ -303,12 +286,10 @@ class TestBlueskyClientSearch:
             params={"q": "mcp", "limit": 5, "cursor": None}
         )
 
-    @pytest.mark.asyncio
     async def test_get_recent_mcp_posts_pagination(
         self, bluesky_client, mock_post_data
     ):
         """Test getting recent MCP posts with pagination."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         # Mock multiple pages of results
@@ -320,46 +301,38 @@ class TestBlueskyClientSearch:
         second_response.posts = [mock_post_data]
         second_response.cursor = None  # No more pages
 
-        bluesky_client.client.app.bsky.feed.search_posts.side_effect = [
-            first_response,
-            second_response,
-        ]
+        bluesky_client.client = _make_authed_client(
+            AsyncMock(side_effect=[first_response, second_response])
+        )
 
-        # Mock asyncio.sleep to avoid actual delays in tests
-        with patch("asyncio.sleep"):
-            posts = await bluesky_client.get_recent_mcp_posts(max_posts=50)
+        posts = await bluesky_client.get_recent_mcp_posts(max_posts=50)
 
         assert len(posts) == 2
         assert bluesky_client.client.app.bsky.feed.search_posts.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_get_recent_mcp_posts_max_limit(self, bluesky_client, mock_post_data):
         """Test max_posts limit is respected."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         mock_response = Mock()
         mock_response.posts = [mock_post_data]
         mock_response.cursor = "has_more"
-        bluesky_client.client.app.bsky.feed.search_posts.return_value = mock_response
+        bluesky_client.client = _make_authed_client(AsyncMock(return_value=mock_response))
 
-        with patch("asyncio.sleep"):
-            posts = await bluesky_client.get_recent_mcp_posts(max_posts=1)
+        posts = await bluesky_client.get_recent_mcp_posts(max_posts=1)
 
         assert len(posts) == 1
         # Should only make one call since we reached max_posts
         assert bluesky_client.client.app.bsky.feed.search_posts.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_get_recent_mcp_posts_no_results(self, bluesky_client):
         """Test getting recent posts when no results found."""
-        bluesky_client.client = AsyncMock()
         bluesky_client._session_active = True
 
         mock_response = Mock()
         mock_response.posts = []
         mock_response.cursor = None
-        bluesky_client.client.app.bsky.feed.search_posts.return_value = mock_response
+        bluesky_client.client = _make_authed_client(AsyncMock(return_value=mock_response))
 
         posts = await bluesky_client.get_recent_mcp_posts(max_posts=10)
 
@@ -4,34 +4,9 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.bluesky.collector import BlueskyDataCollector
-from src.config.settings import Settings
 from src.models.post import BlueskyPost, EngagementMetrics
 
 
-@pytest.fixture
-def mock_settings():
-    """Create mock settings with credentials."""
-    return Settings(
-        r2_access_key_id="test_key",
-        r2_secret_access_key="test_secret",
-        r2_bucket_name="test-bucket",
-        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
-        bluesky_handle="test.bsky.social",
-        bluesky_app_password="test-app-password",
-    )
-
-
-@pytest.fixture
-def mock_settings_no_credentials():
-    """Create mock settings without Bluesky credentials."""
-    return Settings(
-        r2_access_key_id="test_key",
-        r2_secret_access_key="test_secret",
-        r2_bucket_name="test-bucket",
-        r2_endpoint_url="https://test.r2.cloudflarestorage.com",
-    )
-
-
 @pytest.fixture
 def sample_posts():
     """Create sample BlueskyPost instances."""
@@ -72,7 +47,6 @@ class TestBlueskyDataCollectorInit:
 
 
 class TestBlueskyDataCollectorCollectPosts:
-    @pytest.mark.asyncio
     async def test_collect_daily_posts_success(self, collector, sample_posts):
         """Test successful post collection."""
         with patch("src.bluesky.collector.BlueskyClient") as mock_client_class:
@@ -90,7 +64,6 @@ class TestBlueskyDataCollectorCollectPosts:
             assert len(result) == 2
             assert all(isinstance(post, BlueskyPost) for post in result)
 
-    @pytest.mark.asyncio
     async def test_collect_daily_posts_no_credentials(
         self, mock_settings_no_credentials
     ):
@@ -101,7 +74,6 @@ class TestBlueskyDataCollectorCollectPosts:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_collect_daily_posts_default_date(self, collector, sample_posts):
         """Test collection with default date (today)."""
         with patch("src.bluesky.collector.BlueskyClient") as mock_client_class:
@@ -117,7 +89,6 @@ class TestBlueskyDataCollectorCollectPosts:
 
                 assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_collect_daily_posts_exception(self, collector):
         """Test collection handles exceptions gracefully."""
         with patch.object(
@@ -131,7 +102,6 @@ class TestBlueskyDataCollectorCollectPosts:
 
 
 class TestBlueskyDataCollectorStorePosts:
-    @pytest.mark.asyncio
     async def test_store_posts_success(self, collector, sample_posts):
         """Test successful post storage as Parquet."""
         target_date = date(2024, 1, 15)
@@ -150,14 +120,12 @@ class TestBlueskyDataCollectorStorePosts:
             assert call_args[0][1] == "data/2024/01/15/posts.parquet"  # file path
             assert call_args[1]["content_type"] == "application/octet-stream"
 
-    @pytest.mark.asyncio
     async def test_store_posts_empty_list(self, collector):
         """Test storing empty post list."""
         result = await collector.store_posts([], date(2024, 1, 15))
 
         assert result is True  # Empty list is considered success
 
-    @pytest.mark.asyncio
     async def test_store_posts_upload_failure(self, collector, sample_posts):
         """Test storage failure during upload."""
         with patch.object(collector.r2_client, "upload_file", return_value=False):
@@ -165,7 +133,6 @@ class TestBlueskyDataCollectorStorePosts:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_store_posts_exception(self, collector, sample_posts):
         """Test storage handles exceptions."""
         with patch.object(
@@ -177,7 +144,6 @@ class TestBlueskyDataCollectorStorePosts:
 
 
 class TestBlueskyDataCollectorCollectAndStore:
-    @pytest.mark.asyncio
     async def test_collect_and_store_success(self, collector, sample_posts):
         """Test successful collect and store operation."""
         target_date = date(2024, 1, 15)
@@ -191,7 +157,6 @@ class TestBlueskyDataCollectorCollectAndStore:
                 assert count == 2
                 assert success is True
 
-    @pytest.mark.asyncio
     async def test_collect_and_store_no_posts(self, collector):
         """Test collect and store with no posts found."""
         with patch.object(collector, "collect_daily_posts", return_value=[]):
@@ -200,7 +165,6 @@ class TestBlueskyDataCollectorCollectAndStore:
             assert count == 0
             assert success is True  # No posts to store is success
 
-    @pytest.mark.asyncio
     async def test_collect_and_store_storage_failure(self, collector, sample_posts):
         """Test collect and store with storage failure."""
         with patch.object(collector, "collect_daily_posts", return_value=sample_posts):
@@ -210,7 +174,6 @@ class TestBlueskyDataCollectorCollectAndStore:
                 assert count == 2
                 assert success is False
 
-    @pytest.mark.asyncio
     async def test_collect_and_store_default_date(self, collector, sample_posts):
         """Test collect and store with default date."""
         with patch.object(
@@ -226,7 +189,6 @@ class TestBlueskyDataCollectorCollectAndStore:
 
 
 class TestBlueskyDataCollectorRetrievePosts:
-    @pytest.mark.asyncio
     async def test_get_stored_posts_success(self, collector, sample_posts):
         """Test successful retrieval of stored posts from JSON (backward compatibility)."""
         target_date = date(2024, 1, 15)
@@ -251,7 +213,6 @@ class TestBlueskyDataCollectorRetrievePosts:
                 assert result[0].id == "post1"
                 assert result[1].id == "post2"
 
-    @pytest.mark.asyncio
     async def test_get_stored_posts_not_found(self, collector):
         """Test retrieval when no data exists."""
         with patch.object(collector.r2_client, "file_exists", return_value=False):
@@ -259,7 +220,6 @@ class TestBlueskyDataCollectorRetrievePosts:
 
             assert result == []
 
-    @pytest.mark.asyncio
     async def test_get_stored_posts_invalid_json(self, collector):
         """Test retrieval with invalid JSON data."""
         # Mock file_exists to say only JSON exists
@@ -273,7 +233,6 @@ class TestBlueskyDataCollectorRetrievePosts:
 
                 assert result == []
 
-    @pytest.mark.asyncio
     async def test_get_stored_posts_invalid_post_data(self, collector):
         """Test retrieval with invalid post data."""
         # Create JSON with invalid post data
@@ -293,7 +252,6 @@ class TestBlueskyDataCollectorRetrievePosts:
 
                 assert result == []  # Invalid posts should be skipped
 
-    @pytest.mark.asyncio
     async def test_get_stored_posts_exception(self, collector):
         """Test retrieval handles exceptions."""
         with patch.object(
@@ -309,29 +267,31 @@ class TestBlueskyDataCollectorRetrievePosts:
 class TestBlueskyDataCollectorCheckData:
     def test_check_stored_data_exists(self, collector):
         """Test checking for existing data."""
-        with patch.object(collector.r2_client, "file_exists", return_value=True):
+        with patch.object(
+            collector.r2_client,
+            "existing_keys",
+            return_value={"data/2024/01/15/posts.parquet"},
+        ):
             result = collector.check_stored_data(date(2024, 1, 15))
 
             assert result is True
 
     def test_check_stored_data_not_exists(self, collector):
         """Test checking for non-existent data."""
-        with patch.object(collector.r2_client, "file_exists", return_value=False):
+        with patch.object(collector.r2_client, "existing_keys", return_value=set()):
             result = collector.check_stored_data(date(2024, 1, 15))
 
             assert result is False
 
     def test_check_stored_data_correct_path(self, collector):
-        """Test that correct paths are checked for both formats."""
-        # Set up to return False for first call (parquet), True for second (json)
+        """Test that one listing of the day's prefix covers both formats."""
         with patch.object(
-            collector.r2_client, "file_exists", side_effect=[False, True]
-        ) as mock_exists:
+            collector.r2_client,
+            "existing_keys",
+            return_value={"data/2024/01/15/posts.json"},
+        ) as mock_keys:
             result = collector.check_stored_data(date(2024, 1, 15))
 
-            # Should check both parquet and json paths when parquet doesn't exist
-            assert mock_exists.call_count == 2
-            calls = [call[0][0] for call in mock_exists.call_args_list]
-            assert "data/2024/01/15/posts.parquet" in calls
-            assert "data/2024/01/15/posts.json" in calls
+            # The legacy JSON file is found from the same listing
+            mock_keys.assert_called_once_with("data/2024/01/15/")
             assert result is True
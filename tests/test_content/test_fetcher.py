@@ -1,5 +1,4 @@
 """Tests for article fetcher."""
-import pytest
 from unittest.mock import Mock, AsyncMock
 import httpx
 
@@ -32,7 +31,6 @@ class TestArticleFetcher:
         assert not fetcher._is_valid_url("not-a-url")
         assert not fetcher._is_valid_url("")
     
-    @pytest.mark.asyncio
     async def test_invalid_url_returns_error(self):
         """Test that invalid URL validation."""
         fetcher = ArticleFetcher()
@@ -46,7 +44,6 @@ class TestArticleFetcher:
         assert result.error_type == "validation"
         assert "Invalid or unsafe URL" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_successful_fetch(self):
         """Test successful article fetch."""
         # Mock httpx response
@@ -67,7 +64,6 @@ class TestArticleFetcher:
         assert "Test" in result.html
         assert result.headers["content-type"] == "text/html"
     
-    @pytest.mark.asyncio
     async def test_http_error_returns_error(self):
         """Test that HTTP error returns ContentError."""
         mock_response = Mock()
@@ -84,7 +80,6 @@ class TestArticleFetcher:
         assert result.error_type == "permanent_http_error"
         assert "HTTP 404" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_timeout_returns_error(self):
         """Test that timeout returns ContentError."""
         fetcher = ArticleFetcher(max_retries=0)  # No retries for faster test
@@ -96,7 +91,6 @@ class TestArticleFetcher:
         assert result.error_type == "timeout"
         assert "Timeout" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_network_error_returns_error(self):
         """Test that network error returns ContentError."""
         fetcher = ArticleFetcher(max_retries=0)  # No retries for faster test
@@ -110,7 +104,6 @@ class TestArticleFetcher:
         assert result.error_type == "network"
         assert "Network error" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_non_html_content_returns_error(self):
         """Test that non-HTML content returns ContentError."""
         mock_response = Mock()
@@ -126,7 +119,6 @@ class TestArticleFetcher:
         assert result.error_type == "content_type"
         assert "Non-HTML content type" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_content_too_large_returns_error(self):
         """Test that content too large returns ContentError."""
         mock_response = Mock()
@@ -141,7 +133,6 @@ class TestArticleFetcher:
         assert result.error_type == "size"
         assert "Content too large" in result.error_message
     
-    @pytest.mark.asyncio
     async def test_fetch_multiple_empty_list(self):
         """Test fetching empty list returns empty list."""
         fetcher = ArticleFetcher()
@@ -150,7 +141,6 @@ class TestArticleFetcher:
         
         assert result == []
     
-    @pytest.mark.asyncio
     async def test_fetch_multiple_success(self):
         """Test fetching multiple URLs successfully."""
         mock_response = Mock()
@@ -173,7 +163,6 @@ class TestArticleFetcher:
         assert str(results[0].url) == "https://example.com/1"
         assert str(results[1].url) == "https://example.com/2"
     
-    @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test fetcher as async context manager."""
         async with ArticleFetcher() as fetcher:
@@ -7,7 +7,13 @@ from pathlib import Path
 import pytest
 
 from src.models.report import ArchiveLink, HomepageData, ReportArticle, ReportDay
-from src.reports.generator import ReportGenerator
+from src.reports.generator import ReportGenerator, create_environment
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Keep the default template bytecode cache out of the repository root."""
+    monkeypatch.chdir(tmp_path)
 
 
 class TestReportGenerator:
@@ -117,4 +123,42 @@ class TestReportGenerator:
         report_path = generator.generate_daily_report(report_day)
         content = report_path.read_text()
         
-        assert "No MCP-related resources found" in content
\ No newline at end of file
+        assert "No MCP-related resources found" in content
+    
+    def test_failed_render_keeps_existing_report(self, tmp_path):
+        """Test that a render error leaves the previous report intact."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "daily.html").write_text("<p>partial</p>{{ 1 // 0 }}")
+        generator = ReportGenerator(template_dir=template_dir, output_dir=tmp_path / "output")
+        
+        report_dir = tmp_path / "output" / "reports" / "2024-12-06"
+        report_dir.mkdir(parents=True)
+        (report_dir / "report.html").write_text("previous report")
+        
+        report_day = ReportDay.create(report_date=date(2024, 12, 6), articles=[])
+        with pytest.raises(ZeroDivisionError):
+            generator.generate_daily_report(report_day)
+        
+        assert (report_dir / "report.html").read_text() == "previous report"
+        assert [p.name for p in report_dir.iterdir()] == ["report.html"]
+
+
+class TestCreateEnvironment:
+    def test_cache_dir_survives_chdir(self, tmp_path, monkeypatch):
+        """Test that the bytecode cache is created lazily and does not follow the CWD."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "page.html").write_text("<p>{{ value }}</p>")
+        cache_dir = tmp_path / "cache"
+        
+        env = create_environment(template_dir, cache_dir=Path("cache"))
+        assert not cache_dir.exists()
+        
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+        
+        assert env.get_template("page.html").render(value=1) == "<p>1</p>"
+        assert any(cache_dir.iterdir())
+        assert not (elsewhere / "cache").exists()
@@ -0,0 +1,43 @@
+"""Tests for the evaluation index."""
+
+from src.stages.mcp_index import (
+    MCP_INDEX_FILENAME, load_mcp_index, may_be_relevant, record_mcp_evaluation, save_mcp_index,
+    update_mcp_index
+)
+
+
+class TestMcpIndex:
+    def test_indexed_irrelevant_file_is_skipped(self, tmp_path):
+        """Test that an unchanged file the index rules out is skipped."""
+        path = tmp_path / "article.md"
+        path.write_text("evaluation")
+        index = {}
+        record_mcp_evaluation(index, path, {"is_mcp_related": False, "relevance_score": 0.1})
+        save_mcp_index(tmp_path, index)
+        
+        loaded = load_mcp_index(tmp_path)
+        
+        assert not may_be_relevant(loaded, path, 0.4)
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["article.md", MCP_INDEX_FILENAME])
+    
+    def test_changed_or_missing_file_may_be_relevant(self, tmp_path):
+        """Test that files rewritten since indexing, or never indexed, are candidates."""
+        path = tmp_path / "article.md"
+        path.write_text("evaluation")
+        index = {}
+        record_mcp_evaluation(index, path, {"is_mcp_related": False, "relevance_score": 0.1})
+        
+        path.write_text("re-evaluation, now relevant")
+        
+        assert may_be_relevant(index, path, 0.4)
+        assert may_be_relevant(index, tmp_path / "other.md", 0.4)
+    
+    def test_update_skips_unreadable_files(self, tmp_path):
+        """Test that a file that cannot be indexed does not stop the others."""
+        path = tmp_path / "article.md"
+        path.write_text("evaluation")
+        evaluation = {"is_mcp_related": False, "relevance_score": 0.1}
+        
+        update_mcp_index(tmp_path, {"missing.md": evaluation, "article.md": evaluation})
+        
+        assert set(load_mcp_index(tmp_path)) == {"article.md"}
@@ -0,0 +1,119 @@
+"""Tests for the report stage."""
+
+import os
+from datetime import date, datetime
+
+import pytest
+
+from src.models.report import ReportArticle, ReportDay
+from src.stages.report import ReportStage
+
+
+class TestRunReport:
+    @pytest.fixture
+    def stage(self, tmp_path, monkeypatch):
+        """Create a report stage working inside a temp directory."""
+        monkeypatch.chdir(tmp_path)
+        return ReportStage()
+    
+    @pytest.fixture
+    def articles(self):
+        """Create sample articles for testing."""
+        evaluation = {
+            "url": "https://example.com/article1",
+            "title": "Test Article 1",
+            "perex": "A witty summary of the first article",
+            "relevance_score": 0.9,
+            "domain": "example.com",
+            "content_type": "article",
+            "language": "en"
+        }
+        return [
+            ReportArticle.from_post_and_evaluation(
+                post_id="abc123",
+                author="user1.bsky.social",
+                created_at=datetime(2024, 12, 6, 13, 0),
+                evaluation=evaluation
+            )
+        ]
+    
+    async def test_regenerate_rewrites_fresh_report(self, stage, articles):
+        """Test that regenerate=True rewrites a report newer than its inputs."""
+        report_date = date(2024, 12, 6)
+        input_dir = stage.input_stage_path / report_date.isoformat()
+        input_dir.mkdir(parents=True)
+        (input_dir / "evaluation.md").write_text("---\nurl: https://example.com/article1\n---\n")
+        
+        report_path = stage._report_path(report_date)
+        report_path.parent.mkdir(parents=True)
+        report_path.write_text("stale report")
+        os.utime(input_dir / "evaluation.md", ns=(1_000_000_000, 1_000_000_000))
+        assert not stage.should_process_item(input_dir, report_date)
+        
+        result = await stage.run_report(
+            days_back=0, regenerate=True, output_date=report_date,
+            generate_sitemap=False, generate_rss=False, prefetched_articles=articles
+        )
+        
+        assert result["report_generated"] is True
+        assert "Test Article 1" in report_path.read_text()
+    
+    async def test_fresh_report_kept_without_regenerate(self, stage, articles):
+        """Test that regenerate=False keeps a report newer than its inputs."""
+        report_date = date(2024, 12, 6)
+        input_dir = stage.input_stage_path / report_date.isoformat()
+        input_dir.mkdir(parents=True)
+        (input_dir / "evaluation.md").write_text("---\nurl: https://example.com/article1\n---\n")
+        os.utime(input_dir / "evaluation.md", ns=(1_000_000_000, 1_000_000_000))
+        
+        report_path = stage._report_path(report_date)
+        report_path.parent.mkdir(parents=True)
+        report_path.write_text("existing report")
+        
+        result = await stage.run_report(
+            days_back=0, regenerate=False, output_date=report_date,
+            generate_sitemap=False, generate_rss=False, prefetched_articles=articles
+        )
+        
+        assert result["status"] == "up_to_date"
+        assert report_path.read_text() == "existing report"
+    
+    def test_report_without_dated_inputs_is_not_stale(self, stage):
+        """Test that a fallback-built report is not rebuilt when its date has no inputs."""
+        report_date = date(2024, 12, 6)
+        report_path = stage._report_path(report_date)
+        report_path.parent.mkdir(parents=True)
+        report_path.write_text("fallback report")
+        
+        assert not stage.should_process_item(report_path, report_date)
+        
+        (stage.input_stage_path / report_date.isoformat()).mkdir(parents=True)
+        assert not stage.should_process_item(report_path, report_date)
+    
+    async def test_unchanged_regeneration_keeps_metadata_files(self, stage, articles):
+        """Test that regenerating from the same articles does not rewrite the metadata."""
+        report_date = date(2024, 12, 6)
+        run_kwargs = dict(
+            days_back=0, regenerate=True, output_date=report_date,
+            generate_sitemap=False, generate_rss=False, prefetched_articles=articles
+        )
+        metadata_paths = [stage.get_metadata_output_path(report_date), stage.get_metadata_json_path(report_date)]
+        
+        await stage.run_report(**run_kwargs)
+        first_mtimes = [path.stat().st_mtime_ns for path in metadata_paths]
+        await stage.run_report(**run_kwargs)
+        
+        assert [path.stat().st_mtime_ns for path in metadata_paths] == first_mtimes
+    
+    def test_stage_created_after_chdir_renders(self, stage, articles, tmp_path, monkeypatch):
+        """Test that a stage created in another working directory caches templates there."""
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        monkeypatch.chdir(other_dir)
+        
+        report_path = ReportStage().generator.generate_daily_report(
+            ReportDay.create(date(2024, 12, 6), articles)
+        )
+        
+        assert report_path.exists()
+        assert (other_dir / ".jinja_cache").is_dir()
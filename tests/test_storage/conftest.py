@@ -0,0 +1,10 @@
+import pytest
+
+from src.storage.r2_client import R2Client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_r2_clients():
+    """Keep shared R2 clients from leaking between tests that patch boto3."""
+    yield
+    R2Client.clear_instances()
@@ -164,6 +164,17 @@ class TestFileManagerLocalDirectory:
             assert result.parent.exists()
             assert str(result) == file_path_str
 
+    def test_ensure_local_directory_recreates_removed_parent(self):
+        """Test that a parent removed after an earlier call is created again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "removed" / "file.txt"
+            FileManager.ensure_local_directory(file_path)
+            file_path.parent.rmdir()
+
+            FileManager.ensure_local_directory(file_path)
+
+            assert file_path.parent.is_dir()
+
 
 class TestFileManagerConstants:
     def test_base_path_constants(self):
@@ -1,5 +1,6 @@
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -46,6 +47,22 @@ class TestR2ClientInit:
             assert client.settings == mock_settings
             assert client.s3_client is not None
 
+    def test_get_returns_shared_client(self, mock_settings):
+        """Test that R2Client.get reuses one client per credentials and bucket."""
+        with mock_s3():
+            client = R2Client.get(mock_settings)
+            assert R2Client.get(mock_settings) is client
+
+            other_settings = mock_settings.model_copy(update={"r2_bucket_name": "other-bucket"})
+            assert R2Client.get(other_settings) is not client
+
+    def test_clear_instances(self, mock_settings):
+        """Test that clear_instances makes get create a new client."""
+        with mock_s3():
+            client = R2Client.get(mock_settings)
+            R2Client.clear_instances()
+            assert R2Client.get(mock_settings) is not client
+
 
 class TestR2ClientUploadFile:
     def test_upload_file_success(self, mock_r2_client):
@@ -104,6 +121,33 @@ class TestR2ClientUploadBytes:
         assert result is True
 
 
+class TestR2ClientUnchangedUploads:
+    def test_upload_bytes_skips_unchanged(self, mock_r2_client):
+        """Test that identical content is not uploaded again."""
+        mock_r2_client.upload_bytes(b"same content", "test/same.bin")
+
+        with patch.object(mock_r2_client.s3_client, "put_object") as mock_put:
+            assert mock_r2_client.upload_bytes(
+                b"same content", "test/same.bin", skip_unchanged=True
+            ) is True
+            mock_put.assert_not_called()
+
+    def test_upload_bytes_changed_content(self, mock_r2_client):
+        """Test that changed content is uploaded."""
+        mock_r2_client.upload_bytes(b"old content", "test/changed.bin")
+
+        assert mock_r2_client.upload_bytes(
+            b"new content", "test/changed.bin", skip_unchanged=True
+        ) is True
+        assert mock_r2_client.download_bytes("test/changed.bin") == b"new content"
+
+    def test_upload_bytes_does_not_check_remote_by_default(self, mock_r2_client):
+        """Test that plain uploads go straight to PUT without a HEAD request."""
+        with patch.object(mock_r2_client.s3_client, "head_object") as mock_head:
+            assert mock_r2_client.upload_bytes(b"new content", "test/new.bin") is True
+            mock_head.assert_not_called()
+
+
 class TestR2ClientDownloadFile:
     def test_download_file_success(self, mock_r2_client):
         """Test successful file download."""
@@ -198,6 +242,45 @@ class TestR2ClientListFiles:
         assert len(files) <= 3
 
 
+class TestR2ClientExistingKeys:
+    def test_existing_keys_with_prefix(self, mock_r2_client):
+        """Test listing existing keys under a prefix."""
+        mock_r2_client.upload_bytes(b"test1", "data/2024/01/15/posts.parquet")
+        mock_r2_client.upload_bytes(b"test2", "data/2024/01/16/posts.parquet")
+
+        keys = mock_r2_client.existing_keys("data/2024/01/15/")
+        assert keys == {"data/2024/01/15/posts.parquet"}
+
+    def test_existing_keys_tracks_own_writes(self, mock_r2_client):
+        """Test that cached listings follow uploads and deletes."""
+        assert mock_r2_client.existing_keys("data/") == set()
+
+        mock_r2_client.upload_bytes(b"test", "data/file.txt")
+        assert "data/file.txt" in mock_r2_client.existing_keys("data/")
+
+        mock_r2_client.delete_file("data/file.txt")
+        assert "data/file.txt" not in mock_r2_client.existing_keys("data/")
+
+    def test_existing_keys_returns_snapshot(self, mock_r2_client):
+        """Test that callers get a read-only snapshot, not the cached listing."""
+        keys = mock_r2_client.existing_keys("data/")
+        mock_r2_client.upload_bytes(b"test", "data/file.txt")
+
+        assert isinstance(keys, frozenset)
+        assert "data/file.txt" not in keys
+        assert "data/file.txt" in mock_r2_client.existing_keys("data/")
+
+    def test_list_files_paginates(self, mock_r2_client):
+        """Test listing more keys than a single request returns."""
+        for i in range(1005):
+            mock_r2_client.s3_client.put_object(
+                Bucket=mock_r2_client.bucket_name, Key=f"many/{i}.txt", Body=b"x"
+            )
+
+        assert len(mock_r2_client.list_files(prefix="many/")) == 1005
+        assert len(mock_r2_client.existing_keys("many/")) == 1005
+
+
 class TestR2ClientDeleteFile:
     def test_delete_file_success(self, mock_r2_client):
         """Test successful file deletion."""
@@ -340,6 +340,11 @@ class TestTextAnalysis:
         for char in neutral_sample:
             assert is_neutral_character(char)
     
+    def test_get_character_sample_distinct_in_order(self):
+        """Test samples are distinct and in order of first appearance."""
+        samples = get_character_sample('aabbaacc dd', 'latin', limit=3)
+        assert samples == ['a', 'b', 'c']
+    
     def test_get_character_sample_empty_text(self):
         """Test character sampling with empty text."""
         samples = get_character_sample('', 'latin')
@@ -0,0 +1,89 @@
+"""Tests for URL expansion utilities."""
+
+import sqlite3
+
+import httpx
+import pytest
+
+from src.utils.url_expansion import URLExpander
+
+
+class TestURLExpanderPersistentCache:
+    """Test the on-disk expansion cache."""
+    
+    async def test_expansion_survives_restart(self, tmp_path, monkeypatch):
+        """Test that expansions are read back from the cache by a new expander."""
+        cache_path = tmp_path / "expanded_urls.sqlite"
+        
+        async def follow_redirects(self, url):
+            return "https://example.com/article", True
+        
+        monkeypatch.setattr(URLExpander, "_follow_redirects", follow_redirects)
+        async with URLExpander(cache_path=cache_path) as expander:
+            assert await expander.expand_url("https://bit.ly/abc") == "https://example.com/article"
+        
+        async def fail_redirects(self, url):
+            raise AssertionError("cached expansion should not hit the network")
+        
+        monkeypatch.setattr(URLExpander, "_follow_redirects", fail_redirects)
+        async with URLExpander(cache_path=cache_path) as expander:
+            assert await expander.expand_url("https://bit.ly/abc") == "https://example.com/article"
+    
+    async def test_unusable_cache_file_is_ignored(self, tmp_path, monkeypatch):
+        """Test that a cache file that is not a database does not break expansion."""
+        cache_path = tmp_path / "expanded_urls.sqlite"
+        cache_path.write_text("not a database")
+        
+        async def follow_redirects(self, url):
+            return "https://example.com/article", True
+        
+        monkeypatch.setattr(URLExpander, "_follow_redirects", follow_redirects)
+        async with URLExpander(cache_path=cache_path) as expander:
+            assert await expander.expand_url("https://bit.ly/abc") == "https://example.com/article"
+    
+    async def test_cache_errors_are_treated_as_misses(self, tmp_path, monkeypatch):
+        """Test that failing cache reads and writes fall back to expanding the URL."""
+        cache_path = tmp_path / "expanded_urls.sqlite"
+        
+        async def follow_redirects(self, url):
+            return "https://example.com/article", True
+        
+        monkeypatch.setattr(URLExpander, "_follow_redirects", follow_redirects)
+        async with URLExpander(cache_path=cache_path) as expander:
+            # Break the cache after it was opened, so both lookup and insert fail
+            expander._persistent_cache.execute("DROP TABLE expanded_urls")
+            
+            assert await expander.expand_url("https://bit.ly/abc") == "https://example.com/article"
+    
+    async def test_failed_expansion_is_not_persisted(self, tmp_path, monkeypatch):
+        """Test that a URL whose lookup errored is retried by the next run."""
+        cache_path = tmp_path / "expanded_urls.sqlite"
+        
+        async def head_error(url, **kwargs):
+            raise httpx.ConnectTimeout("timed out")
+        
+        async with URLExpander(cache_path=cache_path) as expander:
+            monkeypatch.setattr(expander.client, "head", head_error)
+            assert await expander.expand_url("https://bit.ly/abc") == "https://bit.ly/abc"
+        
+        async def follow_redirects(self, url):
+            return "https://example.com/article", True
+        
+        monkeypatch.setattr(URLExpander, "_follow_redirects", follow_redirects)
+        async with URLExpander(cache_path=cache_path) as expander:
+            assert await expander.expand_url("https://bit.ly/abc") == "https://example.com/article"
+    
+    @pytest.mark.parametrize("status_code", [429, 503])
+    async def test_error_status_is_not_persisted(self, tmp_path, monkeypatch, status_code):
+        """Test that a rate-limited or failing shortener is not cached as its own target."""
+        cache_path = tmp_path / "expanded_urls.sqlite"
+        
+        async def head_status(url, **kwargs):
+            return httpx.Response(status_code, request=httpx.Request("HEAD", url))
+        
+        async with URLExpander(cache_path=cache_path) as expander:
+            monkeypatch.setattr(expander.client, "head", head_status)
+            assert await expander.expand_url("https://bit.ly/abc") == "https://bit.ly/abc"
+        
+        with sqlite3.connect(cache_path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM expanded_urls").fetchone() == (0,)
@@ -1,6 +1,7 @@
 """Tests for URL registry utilities."""
 
 from datetime import datetime
+import io
 import tempfile
 from pathlib import Path
 
@@ -126,6 +127,19 @@ class TestURLRegistry:
             # Clean up
             Path(tmp.name).unlink()
     
+    def test_parquet_save_load_in_memory(self):
+        """Test saving and loading Parquet through a file-like buffer."""
+        registry = URLRegistry()
+        registry.add_url("https://example.com/1", "p1", "@u1")
+        
+        buffer = io.BytesIO()
+        registry.to_parquet(buffer)
+        
+        loaded_registry = URLRegistry.from_parquet(io.BytesIO(buffer.getvalue()))
+        
+        assert len(loaded_registry.df) == 1
+        assert loaded_registry.contains_url("https://example.com/1")
+    
     def test_url_type_handling(self):
         """Test handling of different URL types."""
         from pydantic import HttpUrl
@@ -177,4 +191,79 @@ class TestURLRegistry:
         registry.mark_evaluated("https://unknown.com", True, 0.5)
         
         # Still not in registry
-        assert registry.contains_url("https://unknown.com") is False
\ No newline at end of file
+        assert registry.contains_url("https://unknown.com") is False
+    
+    def test_buffered_adds_on_loaded_registry(self):
+        """Test new URLs buffered on top of a loaded registry behave like stored ones."""
+        registry = URLRegistry()
+        registry.add_url("https://example.com/old", "p1", "@u1")
+        loaded_registry = URLRegistry(registry.df.copy())
+        
+        assert loaded_registry.add_url("https://example.com/old", "p2", "@u2") is False
+        assert loaded_registry.add_url("https://example.com/new", "p3", "@u3") is True
+        assert loaded_registry.add_url("https://example.com/new", "p4", "@u4") is False
+        loaded_registry.mark_evaluated("https://example.com/new", True, 0.7)
+        
+        assert loaded_registry.contains_url("https://example.com/new")
+        assert loaded_registry.is_evaluated("https://example.com/new") is True
+        assert loaded_registry.is_evaluated("https://example.com/old") is False
+        
+        df = loaded_registry.df.set_index('url')
+        assert len(df) == 2
+        assert df.loc["https://example.com/old", 'times_seen'] == 2
+        assert df.loc["https://example.com/new", 'times_seen'] == 2
+        assert df.loc["https://example.com/new", 'first_post_id'] == "p3"
+        assert df.loc["https://example.com/new", 'relevance_score'] == 0.7
+    
+    def test_lookups_on_loaded_registry_with_custom_index(self):
+        """Test URL lookups resolve to the right row regardless of the DataFrame index."""
+        registry = URLRegistry()
+        registry.add_url("https://example.com/a", "p1", "@u1")
+        registry.add_url("https://example.com/b", "p2", "@u2")
+        df = registry.df.copy()
+        df.index = [10, 20]
+        
+        loaded_registry = URLRegistry(df)
+        loaded_registry.add_url("https://example.com/b", "p3", "@u3")
+        loaded_registry.mark_evaluated("https://example.com/b", False, 0.1)
+        
+        assert loaded_registry.df.at[20, 'times_seen'] == 2
+        assert loaded_registry.is_evaluated("https://example.com/b") is True
+        assert loaded_registry.is_evaluated("https://example.com/a") is False
+    
+    def test_text_columns_use_arrow_strings(self):
+        """Test text columns are stored as Arrow-backed strings and survive Parquet."""
+        registry = URLRegistry()
+        registry.add_url("https://example.com/1", "p1", "@u1")
+        
+        buffer = io.BytesIO()
+        registry.to_parquet(buffer)
+        loaded_registry = URLRegistry.from_parquet(io.BytesIO(buffer.getvalue()))
+        
+        for reg in (registry, loaded_registry):
+            for col in ('url', 'first_post_id', 'first_post_author'):
+                assert reg.df[col].dtype == 'string[pyarrow]'
+    
+    def test_mark_evaluated_bulk(self):
+        """Test marking stored and newly added URLs as evaluated in one call."""
+        registry = URLRegistry()
+        registry.add_url("https://example.com/1", "p1", "@u1")
+        registry.add_url("https://example.com/2", "p2", "@u2")
+        loaded_registry = URLRegistry(registry.df.copy())
+        loaded_registry.add_url("https://example.com/3", "p3", "@u3")
+        
+        loaded_registry.mark_evaluated_bulk([
+            ("https://example.com/1", True, 0.9),
+            ("https://example.com/3", False, 0.1),
+            ("https://unknown.com", True, 0.5),
+        ])
+        
+        assert loaded_registry.is_evaluated("https://example.com/1") is True
+        assert loaded_registry.is_evaluated("https://example.com/2") is False
+        assert loaded_registry.is_evaluated("https://example.com/3") is True
+        assert loaded_registry.contains_url("https://unknown.com") is False
+        
+        stats = loaded_registry.get_stats()
+        assert stats['evaluated_urls'] == 2
+        assert stats['mcp_related_urls'] == 1
+        assert stats['avg_relevance_score'] == pytest.approx(0.5)